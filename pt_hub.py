@@ -4,26 +4,37 @@ import sys
 import json
 import time
 import math
-import queue
+import collections
 import threading
 import subprocess
 import shutil
-import glob
-import bisect
+import codecs
+import locale
+import functools
+import itertools
+import mmap
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from pathlib import Path
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, filedialog, messagebox
+import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.patches import Rectangle
 from matplotlib.ticker import FuncFormatter
 from matplotlib.transforms import blended_transform_factory
-from cryptography.fernet import Fernet
 import base64
 
+# Optional C-accelerated JSON parser for the hub_data JSONL files (falls back to stdlib json).
+try:
+    import orjson as _orjson
+    _json_loads = _orjson.loads
+except Exception:
+    _orjson = None
+    _json_loads = json.loads
+
 DARK_BG = "#070B10"
 DARK_BG2 = "#0B1220"
 DARK_PANEL = "#0E1626"
@@ -36,6 +47,49 @@ DARK_ACCENT2 = "#00E5FF"
 DARK_SELECT_BG = "#17324A"
 DARK_SELECT_FG = "#00FF66"
 
+# Tk option database defaults for classic widgets (Text/Listbox/Menu)
+_DARK_OPTION_DB = (
+    ("*Text.background", DARK_PANEL),
+    ("*Text.foreground", DARK_FG),
+    ("*Text.insertBackground", DARK_FG),
+    ("*Text.selectBackground", DARK_SELECT_BG),
+    ("*Text.selectForeground", DARK_SELECT_FG),
+
+    ("*Listbox.background", DARK_PANEL),
+    ("*Listbox.foreground", DARK_FG),
+    ("*Listbox.selectBackground", DARK_SELECT_BG),
+    ("*Listbox.selectForeground", DARK_SELECT_FG),
+
+    ("*Menu.background", DARK_BG2),
+    ("*Menu.foreground", DARK_FG),
+    ("*Menu.activeBackground", DARK_SELECT_BG),
+    ("*Menu.activeForeground", DARK_SELECT_FG),
+)
+
+# Shared tk.Menu colors (menubar + dropdowns)
+_DARK_MENU_KW = dict(bg=DARK_BG2, fg=DARK_FG, activebackground=DARK_SELECT_BG, activeforeground=DARK_SELECT_FG)
+_DARK_SUBMENU_KW = dict(_DARK_MENU_KW, tearoff=0)
+
+# Current Trades column widths at the reference size; scaled to fit on resize
+_TRADES_BASE_WIDTHS: Dict[str, int] = {
+    "coin": 70,
+    "qty": 95,
+    "value": 110,
+    "avg_cost": 110,
+    "buy_price": 110,
+    "buy_pnl": 110,
+    "sell_price": 110,
+    "sell_pnl": 110,
+    "dca_stages": 90,
+    "dca_24h": 80,
+    "next_dca": 160,
+    "trail_line": 110,
+}
+
+# Wrapping chart-tab button styles (configured in _apply_forced_dark_mode)
+_CHART_TAB_STYLE = "ChartTab.TButton"
+_CHART_TAB_SELECTED_STYLE = "ChartTabSelected.TButton"
+
 
 @dataclass
 class _WrapItem:
@@ -53,6 +107,7 @@ class WrapFrame(ttk.Frame):
         self._items: List[_WrapItem] = []
         self._reflow_pending: bool = False
         self._in_reflow: bool = False
+        self._last_layout: Optional[tuple] = None  # (items, (row, col) cells) last gridded
         self.bind("<Configure>", self._schedule_reflow)
 
     def add(self, widget: tk.Widget, padx: Tuple[int, int] = (0, 0), pady: Tuple[int, int] = (0, 0)) -> None:
@@ -71,6 +126,7 @@ class WrapFrame(ttk.Frame):
                 except Exception:
                     pass
         self._items = []
+        self._last_layout = None
         self._schedule_reflow()
 
     def _schedule_reflow(self, event: object = None) -> None:
@@ -92,12 +148,10 @@ class WrapFrame(ttk.Frame):
                 return
             usable_width = max(1, width - 6)
 
-            for it in self._items:
-                it.w.grid_forget()
-
             row = 0
             col = 0
             x = 0
+            cells: List[Tuple[int, int]] = []
 
             for it in self._items:
                 reqw = max(it.w.winfo_reqwidth(), it.w.winfo_width())
@@ -109,9 +163,21 @@ class WrapFrame(ttk.Frame):
                     col = 0
                     x = 0
 
-                it.w.grid(row=row, column=col, sticky="w", padx=it.padx, pady=it.pady)
+                cells.append((row, col))
                 x += needed
                 col += 1
+
+            # Regridding re-fires <Configure> on us (and another reflow), so only
+            # touch the grid when the wrap positions actually changed.
+            layout = (tuple((id(it.w), it.padx, it.pady) for it in self._items), tuple(cells))
+            if layout == self._last_layout:
+                return
+            self._last_layout = layout
+
+            for it in self._items:
+                it.w.grid_forget()
+            for it, (r, c) in zip(self._items, cells):
+                it.w.grid(row=r, column=c, sticky="w", padx=it.padx, pady=it.pady)
         finally:
             self._in_reflow = False
 
@@ -307,6 +373,12 @@ DEFAULT_SETTINGS = {
 
 SETTINGS_FILE = "gui_settings.json"
 
+# Max pending log items per subprocess pipe (each item is one chunk of lines)
+LOG_QUEUE_MAXLEN = 10000
+
+# Line pt_thinker prints when runner_ready.json first flips to ready (keep in sync)
+RUNNER_READY_MARKER = "[RUNNER-READY]"
+
 
 def _safe_read_json(path: str) -> Optional[dict]:
     try:
@@ -316,18 +388,58 @@ def _safe_read_json(path: str) -> Optional[dict]:
         return None
 
 
+@functools.lru_cache(maxsize=512)
+def _norm_upper(s: str) -> str:
+    """s.upper().strip(), memoized (trade rows repeat the same few symbols/tags)."""
+    return s.upper().strip()
+
+
+@functools.lru_cache(maxsize=512)
+def _norm_lower(s: str) -> str:
+    """s.lower().strip(), memoized (trade rows repeat the same few sides)."""
+    return s.lower().strip()
+
+
 def _safe_write_json(path: str, data: dict) -> None:
+    # Serialize up front and hand the file one buffered write (json.dump issues many small ones).
+    # Stdlib json on purpose: orjson would write raw non-ASCII and turn NaN/Infinity into null.
+    buf = json.dumps(data, indent=2).encode("utf-8")
     tmp = f"{path}.tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    with open(tmp, "wb", buffering=65536) as f:
+        f.write(buf)
+        f.flush()
+        os.fsync(f.fileno())
     os.replace(tmp, path)
 
 
+def _file_sig(path: str) -> Optional[Tuple[int, int]]:
+    """(st_mtime_ns, st_size) for change detection, or None if the file can't be stat'ed."""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except Exception:
+        return None
+
+
+# path -> ((st_mtime_ns, st_size), rows); the trade log is re-read only when it changes
+_TRADE_HISTORY_CACHE: Dict[str, Tuple[Tuple[int, int], List[dict]]] = {}
+
+
 def _read_trade_history_jsonl(path: str) -> List[dict]:
     """
     Reads hub_data/trade_history.jsonl written by pt_trader.py.
     Returns a list of dicts (only buy/sell rows).
+    The parsed rows are cached per path by mtime/size and shared between callers,
+    so treat the returned list as read-only.
     """
+    sig = _file_sig(path)
+    if sig is None:
+        _TRADE_HISTORY_CACHE.pop(path, None)
+        return []
+    hit = _TRADE_HISTORY_CACHE.get(path)
+    if hit and hit[0] == sig:
+        return hit[1]
+
     out: List[dict] = []
     try:
         if os.path.isfile(path):
@@ -338,7 +450,7 @@ def _read_trade_history_jsonl(path: str) -> List[dict]:
                         continue
                     try:
                         obj = json.loads(ln)
-                        side = str(obj.get("side", "")).lower().strip()
+                        side = _norm_lower(str(obj.get("side", "")))
                         if side not in ("buy", "sell"):
                             continue
                         out.append(obj)
@@ -346,9 +458,195 @@ def _read_trade_history_jsonl(path: str) -> List[dict]:
                         continue
     except Exception:
         pass
+    _TRADE_HISTORY_CACHE[path] = (sig, out)
     return out
 
 
+# Trade dot kinds (index into the label/color tables below)
+_TRADE_KIND_LABELS = ("BUY", "DCA", "SELL")
+_TRADE_KIND_COLORS = ("red", "purple", "green")
+
+
+# Shared style for the BUY/DCA/SELL labels above trade dots
+_DOT_LABEL_KW = dict(textcoords="offset points", xytext=(0, 10), ha="center", fontsize=8, color=DARK_FG, zorder=7)
+
+
+def _show_dot_labels(ax, pool: list, xs: List[float], ys: List[float], labels: List[str]) -> None:
+    """
+    Position the trade-dot labels, reusing Annotation artists from `pool`
+    (grown on demand) instead of creating one per trade on every refresh.
+    """
+    while len(pool) < len(labels):
+        pool.append(ax.annotate("", (0, 0), **_DOT_LABEL_KW))
+    for ann, x, y, label in zip(pool, xs, ys, labels):
+        ann.set_text(label)
+        ann.xy = (x, y)
+        ann.set_visible(True)
+
+
+def _clear_axes_artists(ax, pool: list, keep: tuple = ()) -> bool:
+    """
+    Remove the last refresh's lines/patches/collections/texts from `ax` (keeps axes styling).
+    Pooled labels in `pool` stay on the axes but are hidden; artists in `keep` are left alone.
+    Returns False if that failed and the caller should fall back to ax.cla().
+    """
+    keep_ids = set(map(id, pool))
+    keep_ids.update(id(a) for a in keep if a is not None)
+    try:
+        for artists in (ax.lines, ax.patches, ax.collections, ax.texts):
+            for a in list(artists):
+                if id(a) not in keep_ids:
+                    a.remove()
+        for ann in pool:
+            ann.set_visible(False)
+        return True
+    except Exception:
+        return False
+
+
+@dataclass
+class _TradeArrays:
+    """Column view of trade_history.jsonl for vectorized chart overlays (sorted by ts)."""
+    ts: np.ndarray      # float64, NaN if unparseable
+    kind: np.ndarray    # int8 index into _TRADE_KIND_LABELS/_TRADE_KIND_COLORS
+    coin: np.ndarray    # object, base coin ("BTC" for "BTC-USD")
+    price: np.ndarray   # float64, NaN if missing/non-positive
+
+
+_TRADE_ARRAYS_CACHE: Dict[str, Tuple[List[dict], _TradeArrays]] = {}
+
+
+def _read_trade_history_arrays(path: str) -> _TradeArrays:
+    """
+    Same rows as _read_trade_history_jsonl(), converted once into parallel arrays.
+    Rebuilt only when the cached row list changes.
+    """
+    rows = _read_trade_history_jsonl(path) if path else []
+    hit = _TRADE_ARRAYS_CACHE.get(path)
+    if hit and hit[0] is rows:
+        return hit[1]
+
+    n = len(rows)
+    ts = np.full(n, np.nan, dtype=np.float64)
+    kind = np.zeros(n, dtype=np.int8)
+    coin = np.empty(n, dtype=object)
+    price = np.full(n, np.nan, dtype=np.float64)
+
+    for i, tr in enumerate(rows):
+        side = _norm_lower(str(tr.get("side", "")))
+        tag = _norm_upper(str(tr.get("tag") or ""))
+        if side == "sell":
+            kind[i] = 2
+        elif tag == "DCA":
+            kind[i] = 1
+
+        sym = _norm_upper(str(tr.get("symbol", "")))
+        coin[i] = (sym.split("-")[0].split("/")[0].strip() if sym else "") or (sym or "?")
+
+        try:
+            ts[i] = float(tr.get("ts"))
+        except Exception:
+            pass
+        try:
+            px = float(tr.get("price"))
+            if px > 0:
+                price[i] = px
+        except Exception:
+            pass
+
+    # Sort by time (NaN last) so a visible window is a contiguous slice
+    order = np.argsort(ts, kind="stable")
+    arrs = _TradeArrays(ts=ts[order], kind=kind[order], coin=coin[order], price=price[order])
+    _TRADE_ARRAYS_CACHE[path] = (rows, arrs)
+    return arrs
+
+
+def _trade_window(ta: _TradeArrays, t_min: float, t_max: float) -> slice:
+    """Slice of the (time-sorted) trade arrays with t_min <= ts <= t_max."""
+    lo = int(np.searchsorted(ta.ts, t_min, side="left"))
+    hi = int(np.searchsorted(ta.ts, t_max, side="right"))
+    return slice(lo, max(lo, hi))
+
+
+def _nearest_sorted_index(sorted_vals: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    For each target, index of the nearest value in an ascending array (ties go left).
+    Vectorized equivalent of bisect_left + comparing against the left neighbour.
+    Raises ValueError if `sorted_vals` is empty (there is no nearest index).
+    """
+    last = len(sorted_vals) - 1
+    if last < 0:
+        raise ValueError("_nearest_sorted_index: sorted_vals is empty")
+    right = np.clip(np.searchsorted(sorted_vals, targets, side="left"), 0, last)
+    left = np.clip(right - 1, 0, last)
+    return np.where(np.abs(sorted_vals[right] - targets) < np.abs(targets - sorted_vals[left]), right, left)
+
+
+def _bucket_means(points: List[Tuple[float, float]], max_keep: int) -> List[Tuple[float, float]]:
+    """
+    Downsample (ts, value) points to `max_keep` points by averaging consecutive buckets.
+    Bucket i covers [int(i * n / max_keep), int((i + 1) * n / max_keep)), so bucket sizes
+    differ by at most one and none is empty. Fewer than `max_keep` points pass through.
+    """
+    n = len(points)
+    if n <= max_keep or max_keep <= 0:
+        return list(points)
+    starts = (np.arange(max_keep) * (n / float(max_keep))).astype(np.int64)
+    counts = np.diff(np.append(starts, n))
+
+    # Average timestamp and account value within each bucket (one reduceat pass)
+    sums = np.add.reduceat(np.asarray(points, dtype=np.float64), starts, axis=0)
+    return [tuple(p) for p in (sums / counts[:, None]).tolist()]
+
+
+# OS "open with default app" command, resolved once (None -> os.startfile on Windows)
+if os.name == "nt":
+    _OPEN_CMD: Optional[List[str]] = None
+elif sys.platform == "darwin":
+    _OPEN_CMD = ["open"]
+else:
+    _OPEN_CMD = ["xdg-open"]
+
+
+def _open_path(path: str) -> None:
+    """Open a file/folder with the OS default handler (doesn't wait for it)."""
+    if _OPEN_CMD is None:
+        os.startfile(path)  # type: ignore[attr-defined]
+    else:
+        subprocess.Popen(_OPEN_CMD + [path])
+
+
+def _tail_lines(path: str, n: int, block: int = 65536) -> List[str]:
+    """Last `n` lines of a text file, reading backwards in blocks (not the whole file)."""
+    if n <= 0:
+        return []  # (splitlines()[-0:] would be every line)
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= n:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    return data.decode("utf-8", errors="replace").splitlines()[-n:]
+
+
+def _canvas_wheel(e) -> None:
+    """Shared <MouseWheel>/<Button-4>/<Button-5> handler for scrollable canvases (routes via e.widget)."""
+    try:
+        # Canvases confine to their scrollregion, so this is a no-op when everything fits.
+        if e.num == 4:  # Linux wheel up
+            units = -3
+        elif e.num == 5:  # Linux wheel down
+            units = 3
+        else:
+            units = int(-1 * (e.delta / 120))
+        e.widget.yview_scroll(units, "units")
+    except Exception:
+        pass
+
+
 def _ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
@@ -362,6 +660,11 @@ def _fmt_money(x: float) -> str:
         return "N/A"
 
 
+def _money_tick_label(y: float, _pos: Any = None) -> str:
+    """Account value axis tick label: dollars with 2 decimals."""
+    return f"${y:,.2f}"
+
+
 def _fmt_price(x: Any) -> str:
     """
     Format a USD *price/level* with dynamic decimals based on magnitude.
@@ -419,6 +722,12 @@ def _now_str() -> str:
     return time.strftime("%Y-%m-%d %H:%M:%S")
 
 
+@functools.lru_cache(maxsize=1024)
+def _fmt_local_ts(ts: int, fmt: str) -> str:
+    """strftime of a whole-second epoch timestamp in local time (memoized for chart labels)."""
+    return time.strftime(fmt, time.localtime(ts))
+
+
 def _fmt_uptime(seconds: float) -> str:
     try:
         s = int(max(0, int(seconds)))
@@ -459,14 +768,17 @@ def build_coin_folders(main_dir: str, coins: List[str]) -> Dict[str, str]:
     out["BTC"] = str(md)
 
     # Auto-detect subfolders
-    if md.is_dir():
-        for p in md.iterdir():
-            if not p.is_dir():
-                continue
-            name = p.name
-            sym = name.upper().strip()
-            if sym in coins and sym != "BTC":
-                out[sym] = str(p.resolve(strict=False))
+    # (scandir: DirEntry.is_dir() uses the readdir type info, no stat per entry)
+    try:
+        with os.scandir(md) as it:
+            for e in it:
+                if not e.is_dir():
+                    continue
+                sym = e.name.upper().strip()
+                if sym in coins and sym != "BTC":
+                    out[sym] = str(Path(e.path).resolve(strict=False))
+    except OSError:
+        pass
 
     # Fallbacks for missing ones
     for c in coins:
@@ -559,8 +871,20 @@ class CandleFetcher:
     Uses kucoin-python if available; otherwise falls back to KuCoin REST via requests.
     """
     def __init__(self):
-        self._mode = "kucoin_client"
+        # The KuCoin client / requests are imported on the first fetch (not at hub startup).
+        self._mode: Optional[str] = None
         self._market = None
+
+        # Small in-memory cache to keep timeframe switching snappy.
+        # key: (pair, timeframe, limit) -> (saved_time_epoch, candles)
+        self._cache: Dict[Tuple[str, str, int], Tuple[float, List[dict]]] = {}
+        self._cache_ttl_seconds: float = 10.0
+
+
+    def _ensure_client(self) -> None:
+        if self._mode is not None:
+            return
+        self._mode = "kucoin_client"
         try:
             from kucoin.client import Market  # type: ignore
             self._market = Market(url="https://api.kucoin.com")
@@ -572,12 +896,6 @@ class CandleFetcher:
             import requests  # local import
             self._requests = requests
 
-        # Small in-memory cache to keep timeframe switching snappy.
-        # key: (pair, timeframe, limit) -> (saved_time_epoch, candles)
-        self._cache: Dict[Tuple[str, str, int], Tuple[float, List[dict]]] = {}
-        self._cache_ttl_seconds: float = 10.0
-
-
     def get_klines(self, symbol: str, timeframe: str, limit: int = 120) -> List[dict]:
         """
         Returns candles oldest->newest as:
@@ -605,6 +923,7 @@ class CandleFetcher:
         end_at = int(now)
         start_at = end_at - (tf_seconds * max(200, (limit + 50) if limit else 250))
 
+        self._ensure_client()
         if self._mode == "kucoin_client" and self._market is not None:
             try:
                 # IMPORTANT: limit the server response by passing startAt/endAt.
@@ -659,6 +978,12 @@ class CandleFetcher:
 # -----------------------------
 
 class CandleChart(ttk.Frame):
+    # Overlay line styles (shared, so each refresh doesn't rebuild the kwargs)
+    _STYLE_TRAIL = {"linewidth": 1.5, "color": "green", "alpha": 0.95}
+    _STYLE_DCA = {"linewidth": 1.5, "color": "red", "alpha": 0.95}
+    _STYLE_ASK = {"linewidth": 1.5, "color": "purple", "alpha": 0.95}
+    _STYLE_BID = {"linewidth": 1.5, "color": "teal", "alpha": 0.95}
+
     def __init__(
         self,
         parent: tk.Widget,
@@ -747,7 +1072,7 @@ class CandleChart(ttk.Frame):
         # Multiplying by tk scaling here makes the renderer larger than the PhotoImage,
         # which produces the "blank/covered strip" on the right.
         self._last_canvas_px = (0, 0)
-        self._resize_after_id = None
+        self._dot_labels: list = []  # reusable trade-dot Annotation artists
 
         def _on_canvas_configure(e):
             try:
@@ -763,13 +1088,8 @@ class CandleChart(ttk.Frame):
                 dpi = float(self.fig.get_dpi() or 100.0)
                 self.fig.set_size_inches(w / dpi, h / dpi, forward=True)
 
-                # Debounce redraws during live resize
-                if self._resize_after_id:
-                    try:
-                        self.after_cancel(self._resize_after_id)
-                    except Exception:
-                        pass
-                self._resize_after_id = self.after_idle(self.canvas.draw_idle)
+                # draw_idle() coalesces the redraws of a live resize
+                self.canvas.draw_idle()
             except Exception:
                 pass
 
@@ -783,6 +1103,32 @@ class CandleChart(ttk.Frame):
 
         self._last_refresh = 0.0
 
+        # Per-folder neural file paths (rebuilt only when the coin folder changes)
+        self._paths_folder: Optional[str] = None
+        self._low_path = ""
+        self._high_path = ""
+        self._long_sig_path = ""
+
+
+    def _set_folder_paths(self, folder: str) -> None:
+        if folder == self._paths_folder:
+            return
+        self._paths_folder = folder
+        self._low_path = os.path.join(folder, "low_bound_prices.html")
+        self._high_path = os.path.join(folder, "high_bound_prices.html")
+        self._long_sig_path = os.path.join(folder, "long_dca_signal.txt")
+
+    def _clear_artists(self) -> None:
+        """Remove last refresh's artists (keeps axes styling; pooled trade labels are just hidden)."""
+        try:
+            if _clear_axes_artists(self.ax, self._dot_labels):
+                self.ax.relim()
+                return
+        except Exception:
+            pass
+        self.ax.cla()
+        self._apply_dark_chart_style()
+        self._dot_labels = []
 
     def _apply_dark_chart_style(self) -> None:
         """Apply dark styling (called on init and after every ax.clear())."""
@@ -814,8 +1160,9 @@ class CandleChart(ttk.Frame):
         candles = self.fetcher.get_klines(self.coin, tf, limit=limit)
 
         folder = coin_folders.get(self.coin, "")
-        low_path = os.path.join(folder, "low_bound_prices.html")
-        high_path = os.path.join(folder, "high_bound_prices.html")
+        self._set_folder_paths(folder)
+        low_path = self._low_path
+        high_path = self._high_path
 
         # --- Cached neural reads (per path, by mtime) ---
         if not hasattr(self, "_neural_cache"):
@@ -836,20 +1183,11 @@ class CandleChart(ttk.Frame):
         long_levels = _cached(low_path, read_price_levels_from_html, []) if folder else []
         short_levels = _cached(high_path, read_price_levels_from_html, []) if folder else []
 
-        long_sig_path = os.path.join(folder, "long_dca_signal.txt")
-        long_sig = _cached(long_sig_path, read_int_from_file, 0) if folder else 0
+        long_sig = _cached(self._long_sig_path, read_int_from_file, 0) if folder else 0
         short_sig = read_short_signal(folder) if folder else 0
 
         # --- Avoid full ax.clear() (expensive). Just clear artists. ---
-        try:
-            self.ax.lines.clear()
-            self.ax.patches.clear()
-            self.ax.collections.clear()  # scatter dots live here
-            self.ax.texts.clear()        # labels/annotations live here
-        except Exception:
-            # fallback if matplotlib version lacks .clear() on these lists
-            self.ax.cla()
-            self._apply_dark_chart_style()
+        self._clear_artists()
 
 
         if not candles:
@@ -899,28 +1237,27 @@ class CandleChart(ttk.Frame):
             self.ax.add_patch(r)
 
         # Lock y-limits to candle range so overlay lines can go offscreen without expanding the chart.
+        y_lim: Optional[Tuple[float, float]] = None
         try:
             y_low = min(float(c["low"]) for c in candles)
             y_high = max(float(c["high"]) for c in candles)
             pad = (y_high - y_low) * 0.03
             if not math.isfinite(pad) or pad <= 0:
                 pad = max(abs(y_low) * 0.001, 1e-6)
-            self.ax.set_ylim(y_low - pad, y_high + pad)
+            y_lim = (y_low - pad, y_high + pad)
+            self.ax.set_ylim(*y_lim)
         except Exception:
-            pass
-
+            y_lim = None
 
 
-        # Overlay Neural levels (blue long, orange short)
-        for lv in long_levels:
-            try:
-                self.ax.axhline(y=float(lv), linewidth=1, color="blue", alpha=0.8)
-            except Exception:
-                pass
 
-        for lv in short_levels:
+        # Overlay Neural levels (blue long, orange short) - one collection per side
+        y_axis_trans = self.ax.get_yaxis_transform()
+        for levels, level_color in ((long_levels, "blue"), (short_levels, "orange")):
             try:
-                self.ax.axhline(y=float(lv), linewidth=1, color="orange", alpha=0.8)
+                arr = np.asarray(levels, dtype=float)
+                if arr.size:
+                    self.ax.hlines(arr, 0, 1, transform=y_axis_trans, linewidth=1, color=level_color, alpha=0.8)
             except Exception:
                 pass
 
@@ -928,26 +1265,26 @@ class CandleChart(ttk.Frame):
         # Overlay Trailing PM line (sell) and next DCA line
         try:
             if trail_line is not None and float(trail_line) > 0:
-                self.ax.axhline(y=float(trail_line), linewidth=1.5, color="green", alpha=0.95)
+                self.ax.axhline(y=float(trail_line), **self._STYLE_TRAIL)
         except Exception:
             pass
 
         try:
             if dca_line_price is not None and float(dca_line_price) > 0:
-                self.ax.axhline(y=float(dca_line_price), linewidth=1.5, color="red", alpha=0.95)
+                self.ax.axhline(y=float(dca_line_price), **self._STYLE_DCA)
         except Exception:
             pass
 
         # Overlay current ask/bid prices
         try:
             if current_buy_price is not None and float(current_buy_price) > 0:
-                self.ax.axhline(y=float(current_buy_price), linewidth=1.5, color="purple", alpha=0.95)
+                self.ax.axhline(y=float(current_buy_price), **self._STYLE_ASK)
         except Exception:
             pass
 
         try:
             if current_sell_price is not None and float(current_sell_price) > 0:
-                self.ax.axhline(y=float(current_sell_price), linewidth=1.5, color="teal", alpha=0.95)
+                self.ax.axhline(y=float(current_sell_price), **self._STYLE_BID)
         except Exception:
             pass
 
@@ -955,7 +1292,7 @@ class CandleChart(ttk.Frame):
         try:
             trans = blended_transform_factory(self.ax.transAxes, self.ax.transData)
             used_y: List[float] = []
-            y0, y1 = self.ax.get_ylim()
+            y0, y1 = y_lim if y_lim is not None else self.ax.get_ylim()
             y_pad = max((y1 - y0) * 0.012, 1e-9)
 
             def _label_right(y: Optional[float], tag: str, color: str) -> None:
@@ -1007,75 +1344,31 @@ class CandleChart(ttk.Frame):
 
         # --- Trade dots (BUY / DCA / SELL) for THIS coin only ---
         try:
-            trades = _read_trade_history_jsonl(self.trade_history_path) if self.trade_history_path else []
-            if trades:
-                candle_ts = [int(c["ts"]) for c in candles]  # oldest->newest
-                t_min = float(candle_ts[0])
-                t_max = float(candle_ts[-1])
-
-                for tr in trades:
-                    sym = str(tr.get("symbol", "")).upper()
-                    base = sym.split("-")[0].strip() if sym else ""
-                    if base != self.coin.upper().strip():
-                        continue
-
-                    side = str(tr.get("side", "")).lower().strip()
-                    tag = str(tr.get("tag") or "").upper().strip()
-
-                    if side == "buy":
-                        label = "DCA" if tag == "DCA" else "BUY"
-                        color = "purple" if tag == "DCA" else "red"
-                    elif side == "sell":
-                        label = "SELL"
-                        color = "green"
-                    else:
-                        continue
-
-                    tts = tr.get("ts", None)
-                    if tts is None:
-                        continue
-                    try:
-                        tts = float(tts)
-                    except Exception:
-                        continue
-                    if tts < t_min or tts > t_max:
-                        continue
-
-                    i = bisect.bisect_left(candle_ts, tts)
-                    if i <= 0:
-                        idx = 0
-                    elif i >= len(candle_ts):
-                        idx = len(candle_ts) - 1
-                    else:
-                        idx = i if abs(candle_ts[i] - tts) < abs(tts - candle_ts[i - 1]) else (i - 1)
+            ta = _read_trade_history_arrays(self.trade_history_path)
+            if len(ta.ts):
+                candle_ts = np.asarray([int(c["ts"]) for c in candles], dtype=np.float64)  # oldest->newest
+                w = _trade_window(ta, candle_ts[0], candle_ts[-1])
+                m = ta.coin[w] == self.coin.upper().strip()
+                if m.any():
+                    kinds = ta.kind[w][m]
+                    idx = _nearest_sorted_index(candle_ts, ta.ts[w][m])
 
                     # y = trade price if present, else candle close
-                    y = None
-                    try:
-                        p = tr.get("price", None)
-                        if p is not None and float(p) > 0:
-                            y = float(p)
-                    except Exception:
-                        y = None
-                    if y is None:
-                        try:
-                            y = float(candles[idx].get("close", 0.0))
-                        except Exception:
-                            y = None
-                    if y is None:
-                        continue
-
-                    x = idx
-                    self.ax.scatter([x], [y], s=35, color=color, zorder=6)
-                    self.ax.annotate(
-                        label,
-                        (x, y),
-                        textcoords="offset points",
-                        xytext=(0, 10),
-                        ha="center",
-                        fontsize=8,
-                        color=DARK_FG,
-                        zorder=7,
+                    closes = np.asarray([float(c.get("close", 0.0)) for c in candles], dtype=np.float64)
+                    prices = ta.price[w][m]
+                    ys_dot = np.where(np.isnan(prices), closes[idx], prices)
+
+                    # one scatter collection per kind instead of one per trade
+                    for k in np.unique(kinds).tolist():
+                        sel = kinds == k
+                        self.ax.scatter(idx[sel], ys_dot[sel], s=35, color=_TRADE_KIND_COLORS[k], zorder=6)
+
+                    _show_dot_labels(
+                        self.ax,
+                        self._dot_labels,
+                        idx.tolist(),
+                        ys_dot.tolist(),
+                        [_TRADE_KIND_LABELS[k] for k in kinds.tolist()],
                     )
         except Exception:
             pass
@@ -1107,7 +1400,7 @@ class CandleChart(ttk.Frame):
 
         tick_x = [xs[i] for i in idxs]
         tick_lbl = [
-            time.strftime("%Y-%m-%d\n%H:%M", time.localtime(int(candles[i].get("ts", 0))))
+            _fmt_local_ts(int(candles[i].get("ts", 0)), "%Y-%m-%d\n%H:%M")
             for i in idxs
         ]
 
@@ -1136,7 +1429,7 @@ class CandleChart(ttk.Frame):
             last_ts = None
 
         if last_ts:
-            self.last_update_label.config(text=f"Last: {time.strftime('%H:%M:%S', time.localtime(last_ts))}")
+            self.last_update_label.config(text=f"Last: {_fmt_local_ts(int(last_ts), '%H:%M:%S')}")
         else:
             self.last_update_label.config(text="Last: N/A")
 
@@ -1154,6 +1447,16 @@ class AccountValueChart(ttk.Frame):
         self.max_points = min(int(max_points or 0) or 250, 250)
         self._last_mtime: Optional[float] = None
 
+        # Incremental history reader state: byte offset already parsed + the parsed points.
+        self._hist_offset = 0
+        self._hist_points: List[Tuple[float, float]] = []
+
+        # x positions are always 0..n-1 with n <= 250; reuse slice views of one buffer
+        self._xs_buf = np.arange(250)
+
+        # y-axis tick formatter, built once per chart
+        self._money_fmt = FuncFormatter(_money_tick_label)
+
 
         top = ttk.Frame(self)
         top.pack(fill="x", padx=6, pady=6)
@@ -1186,7 +1489,8 @@ class AccountValueChart(ttk.Frame):
         # Multiplying by tk scaling here makes the renderer larger than the PhotoImage,
         # which produces the "blank/covered strip" on the right.
         self._last_canvas_px = (0, 0)
-        self._resize_after_id = None
+        self._dot_labels: list = []  # reusable trade-dot Annotation artists
+        self._value_line = None      # persistent Line2D, updated with set_data()
 
         def _on_canvas_configure(e):
             try:
@@ -1202,13 +1506,8 @@ class AccountValueChart(ttk.Frame):
                 dpi = float(self.fig.get_dpi() or 100.0)
                 self.fig.set_size_inches(w / dpi, h / dpi, forward=True)
 
-                # Debounce redraws during live resize
-                if self._resize_after_id:
-                    try:
-                        self.after_cancel(self._resize_after_id)
-                    except Exception:
-                        pass
-                self._resize_after_id = self.after_idle(self.canvas.draw_idle)
+                # draw_idle() coalesces the redraws of a live resize
+                self.canvas.draw_idle()
             except Exception:
                 pass
 
@@ -1221,6 +1520,18 @@ class AccountValueChart(ttk.Frame):
 
 
 
+    def _clear_artists(self) -> None:
+        """
+        Remove last refresh's artists (keeps axes styling).
+        The value line and pooled trade labels persist and are updated in place.
+        """
+        if _clear_axes_artists(self.ax, self._dot_labels, keep=(self._value_line,)):
+            return
+        self.ax.cla()
+        self._apply_dark_chart_style()
+        self._dot_labels = []
+        self._value_line = None
+
     def _apply_dark_chart_style(self) -> None:
         try:
             self.fig.patch.set_facecolor(DARK_BG)
@@ -1232,6 +1543,64 @@ class AccountValueChart(ttk.Frame):
         except Exception:
             pass
 
+    def _read_history_points(self, path: str) -> List[Tuple[float, float]]:
+        """
+        Return all (ts, total_account_value) points from the history JSONL.
+        The file is append-only, so only the bytes written since the last call are
+        mmapped and parsed. If the file shrank (reset/rotated) we start over.
+        """
+        try:
+            size = os.path.getsize(path)
+        except Exception:
+            self._hist_offset = 0
+            self._hist_points = []
+            return []
+
+        if size < self._hist_offset:
+            self._hist_offset = 0
+            self._hist_points = []
+
+        if size > self._hist_offset:
+            try:
+                with open(path, "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        # Only parse complete lines; a partially-written last line is picked up next time.
+                        end = mm.rfind(b"\n", self._hist_offset) + 1
+                        if end > self._hist_offset:
+                            chunk = mm[self._hist_offset:end]
+                            self._hist_offset = end
+                        else:
+                            chunk = b""
+                    finally:
+                        mm.close()
+            except Exception:
+                chunk = b""
+
+            append = self._hist_points.append
+            for ln in chunk.split(b"\n"):
+                if not ln:
+                    continue
+                try:
+                    obj = _json_loads(ln)
+                    ts = obj.get("ts", None)
+                    v = obj.get("total_account_value", None)
+                    if ts is None or v is None:
+                        continue
+
+                    tsf = float(ts)
+                    vf = float(v)
+
+                    # Drop obviously invalid points early
+                    if (not math.isfinite(tsf)) or (not math.isfinite(vf)) or (vf <= 0.0):
+                        continue
+
+                    append((tsf, vf))
+                except Exception:
+                    continue
+
+        return list(self._hist_points)
+
     def refresh(self) -> None:
         path = self.history_path
 
@@ -1254,34 +1623,7 @@ class AccountValueChart(ttk.Frame):
         self._last_mtime = mtime
 
 
-        points: List[Tuple[float, float]] = []
-
-        try:
-            if os.path.isfile(path):
-                # Read the FULL history so the chart shows from the very beginning
-                with open(path, "r", encoding="utf-8") as f:
-                    lines = f.read().splitlines()
-
-                for ln in lines:
-                    try:
-                        obj = json.loads(ln)
-                        ts = obj.get("ts", None)
-                        v = obj.get("total_account_value", None)
-                        if ts is None or v is None:
-                            continue
-
-                        tsf = float(ts)
-                        vf = float(v)
-
-                        # Drop obviously invalid points early
-                        if (not math.isfinite(tsf)) or (not math.isfinite(vf)) or (vf <= 0.0):
-                            continue
-
-                        points.append((tsf, vf))
-                    except Exception:
-                        continue
-        except Exception:
-            points = []
+        points = self._read_history_points(path)
 
         # ---- Clean up history so single-tick bogus dips/spikes don't render ----
         if points:
@@ -1304,120 +1646,66 @@ class AccountValueChart(ttk.Frame):
         n = len(points)
 
         if n > max_keep:
-            bucket_size = n / float(max_keep)
-            new_points: List[Tuple[float, float]] = []
-
-            for i in range(max_keep):
-                start = int(i * bucket_size)
-                end = int((i + 1) * bucket_size)
-                if end <= start:
-                    end = start + 1
-                if start >= n:
-                    break
-                if end > n:
-                    end = n
-
-                bucket = points[start:end]
-                if not bucket:
-                    continue
-
-                # Average timestamp and account value within the bucket
-                avg_ts = sum(p[0] for p in bucket) / len(bucket)
-                avg_val = sum(p[1] for p in bucket) / len(bucket)
-
-                new_points.append((avg_ts, avg_val))
-
-            points = new_points
+            points = _bucket_means(points, max_keep)
 
 
         # clear artists (fast) / fallback to cla()
-        try:
-            self.ax.lines.clear()
-            self.ax.patches.clear()
-            self.ax.collections.clear()  # scatter dots live here
-            self.ax.texts.clear()        # labels/annotations live here
-        except Exception:
-            self.ax.cla()
-            self._apply_dark_chart_style()
+        self._clear_artists()
 
 
         if not points:
+            if self._value_line is not None:
+                self._value_line.set_data([], [])
             self.ax.set_title("Account Value - no data", color=DARK_FG)
             self.last_update_label.config(text="Last: N/A")
             self.canvas.draw_idle()
             return
 
-        xs = list(range(len(points)))
+        pts_arr = np.asarray(points, dtype=np.float64)  # shape (n, 2): ts, value
+        ts_arr = pts_arr[:, 0]
+        xs = self._xs_buf[:len(points)]
         # Only show cent-level changes (hide sub-cent noise)
-        ys = [round(p[1], 2) for p in points]
+        ys = np.round(pts_arr[:, 1], 2)
 
-        self.ax.plot(xs, ys, linewidth=1.5)
+        if self._value_line is None:
+            self._value_line, = self.ax.plot(xs, ys, linewidth=1.5)
+        else:
+            self._value_line.set_data(xs, ys)
+            self.ax.relim()
+            self.ax.autoscale_view()
 
         # --- Trade dots (BUY / DCA / SELL) for ALL coins ---
         try:
-            trades = _read_trade_history_jsonl(self.trade_history_path) if self.trade_history_path else []
-            if trades:
-                ts_list = [float(p[0]) for p in points]  # matches xs/ys indices
-                t_min = ts_list[0]
-                t_max = ts_list[-1]
-
-                for tr in trades:
-                    # Determine label/color
-                    side = str(tr.get("side", "")).lower().strip()
-                    tag = str(tr.get("tag", "")).upper().strip()
-
-                    if side == "buy":
-                        action_label = "DCA" if tag == "DCA" else "BUY"
-                        color = "purple" if tag == "DCA" else "red"
-                    elif side == "sell":
-                        action_label = "SELL"
-                        color = "green"
-                    else:
-                        continue
+            ta = _read_trade_history_arrays(self.trade_history_path)
+            if len(ta.ts):
+                w = _trade_window(ta, ts_arr[0], ts_arr[-1])
+                if w.stop > w.start:
+                    kinds = ta.kind[w]
+                    # nearest account-value point for every trade in one searchsorted pass
+                    idx = _nearest_sorted_index(ts_arr, ta.ts[w])
+
+                    # one scatter collection per kind instead of one per trade
+                    for k in np.unique(kinds).tolist():
+                        sel = idx[kinds == k]
+                        self.ax.scatter(sel, ys[sel], s=30, color=_TRADE_KIND_COLORS[k], zorder=6)
 
                     # Prefix with coin (so the dot says which coin it is)
-                    sym = str(tr.get("symbol", "")).upper().strip()
-                    coin_tag = (sym.split("-")[0].split("/")[0].strip() if sym else "") or (sym or "?")
-                    label = f"{coin_tag} {action_label}"
-
-                    tts = tr.get("ts")
-                    try:
-                        tts = float(tts)
-                    except Exception:
-                        continue
-                    if tts < t_min or tts > t_max:
-                        continue
-
-                    # nearest account-value point
-                    i = bisect.bisect_left(ts_list, tts)
-                    if i <= 0:
-                        idx = 0
-                    elif i >= len(ts_list):
-                        idx = len(ts_list) - 1
-                    else:
-                        idx = i if abs(ts_list[i] - tts) < abs(tts - ts_list[i - 1]) else (i - 1)
-
-                    x = idx
-                    y = ys[idx]
-
-                    self.ax.scatter([x], [y], s=30, color=color, zorder=6)
-                    self.ax.annotate(
-                        label,
-                        (x, y),
-                        textcoords="offset points",
-                        xytext=(0, 10),
-                        ha="center",
-                        fontsize=8,
-                        color=DARK_FG,
-                        zorder=7,
+                    _show_dot_labels(
+                        self.ax,
+                        self._dot_labels,
+                        idx.tolist(),
+                        ys[idx].tolist(),
+                        [f"{coin_tag} {_TRADE_KIND_LABELS[k]}" for k, coin_tag in zip(kinds.tolist(), ta.coin[w].tolist())],
                     )
 
         except Exception:
             pass
 
-        # Force 2 decimals on the y-axis labels (account value chart only)
+        # Force 2 decimals on the y-axis labels (account value chart only).
+        # Only (re)attach when missing, e.g. after a cla() fallback reset the axis.
         try:
-            self.ax.yaxis.set_major_formatter(FuncFormatter(lambda y, _pos: f"${y:,.2f}"))
+            if self.ax.yaxis.get_major_formatter() is not self._money_fmt:
+                self.ax.yaxis.set_major_formatter(self._money_fmt)
         except Exception:
             pass
 
@@ -1441,7 +1729,7 @@ class AccountValueChart(ttk.Frame):
                 last = i
 
         tick_x = [xs[i] for i in idxs]
-        tick_lbl = [time.strftime("%Y-%m-%d\n%H:%M:%S", time.localtime(points[i][0])) for i in idxs]
+        tick_lbl = [_fmt_local_ts(int(points[i][0]), "%Y-%m-%d\n%H:%M:%S") for i in idxs]
         try:
             self.ax.minorticks_off()
             self.ax.set_xticks(tick_x)
@@ -1463,7 +1751,7 @@ class AccountValueChart(ttk.Frame):
 
         try:
             self.last_update_label.config(
-                text=f"Last: {time.strftime('%H:%M:%S', time.localtime(points[-1][0]))}"
+                text=f"Last: {_fmt_local_ts(int(points[-1][0]), '%H:%M:%S')}"
             )
         except Exception:
             self.last_update_label.config(text="Last: N/A")
@@ -1491,7 +1779,7 @@ class LogProc:
     A running process with a live log queue for stdout/stderr lines.
     """
     info: ProcInfo
-    log_q: "queue.Queue[str]"
+    log_q: "Deque[str]"
     thread: Optional[threading.Thread] = None
     is_trainer: bool = False
     coin: Optional[str] = None
@@ -1519,8 +1807,9 @@ def _get_master_key() -> str:
         os.chmod(key_path, 0o600)
         return key
 
-def _get_cipher() -> "Fernet":
-    """Get the Fernet cipher for encryption/decryption."""
+def _get_cipher():
+    """Get the Fernet cipher for encryption/decryption (a cryptography.fernet.Fernet)."""
+    from cryptography.fernet import Fernet  # local import (only needed when API keys are used)
     master_key = _get_master_key()
     return Fernet(master_key.encode())
 
@@ -1568,6 +1857,11 @@ def _set_api_key(provider: str, key_type: str, value: str) -> None:
 
 
 class PowerTraderHub(tk.Tk):
+    # Panedwindows whose sashes are clamped so no pane can collapse
+    _PANE_ATTRS = ("_pw_outer", "_pw_left_split", "_pw_right_split", "_pw_right_bottom_split")
+    _panes: Tuple[ttk.Panedwindow, ...] = ()  # filled at the end of _build_layout
+    _CONFIGURE_CLAMP_MS = 50  # throttle for <Configure>-driven sash clamps
+
     def __init__(self):
         super().__init__()
         self.title("PowerTrader - Hub")
@@ -1579,6 +1873,16 @@ class PowerTraderHub(tk.Tk):
 
         # Debounce map for panedwindow clamp operations
         self._paned_clamp_after_ids: Dict[str, str] = {}
+        # (panedwindow path, pane path) -> minsize; reset whenever _build_layout sets minsizes
+        self._pane_minsize_cache: Dict[Tuple[str, str], int] = {}
+
+        # coins with a chart refresh already queued by _show_chart_page
+        self._pending_chart_refresh: set = set()
+        # coin -> (inputs signature, time) of its last chart refresh
+        self._last_refresh_sig: Dict[str, Tuple[tuple, float]] = {}
+
+        # single pending _check_training_queue timer (see _schedule_training_queue_check)
+        self._training_queue_after_id: Optional[str] = None
 
         # Force one and only one theme: dark mode everywhere.
         self._apply_forced_dark_mode()
@@ -1605,6 +1909,15 @@ class PowerTraderHub(tk.Tk):
 
         # file written by pt_thinker.py (runner readiness gate used for Start All)
         self.runner_ready_path = os.path.join(self.hub_dir, "runner_ready.json")
+        # set by the runner's reader thread when it prints RUNNER_READY_MARKER
+        self.runner_ready_event = threading.Event()
+        self._runner_ready_file_delay = 0.1
+        self._runner_ready_file_next = 0.0
+
+        # coin -> ((folder, status sig, stamp sig), training?, stamp ts); see _coin_is_trained
+        self._trained_cache: Dict[str, Tuple[tuple, bool, float]] = {}
+        # trainer_status.json path -> (file sig, state); shared by _running_trainers/_coin_is_trained
+        self._trainer_state_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
 
 
         # internal: when Start All is pressed, we start the runner first and only start the trader once ready
@@ -1627,50 +1940,11 @@ class PowerTraderHub(tk.Tk):
         # On startup, create missing alt folders (no trainer copy needed)
         self._ensure_alt_coin_folders_on_startup()
 
-        # Ensure initial trainer status files exist for each coin (default NOT_TRAINED)
-        try:
-            for coin in self.coins:
-                try:
-                    coin_u = (coin or "").strip().upper()
-                    folder = self.coin_folders.get(coin_u) or self.coin_folders.get(coin) or self.project_dir
-                    if not folder:
-                        continue
-                    status_path = os.path.join(folder, "trainer_status.json")
-                    if not os.path.isfile(status_path):
-                        st = {"state": "NOT_TRAINED"}
-                        try:
-                            os.makedirs(folder, exist_ok=True)
-                        except Exception:
-                            pass
-                        try:
-                            with open(status_path, "w", encoding="utf-8") as f:
-                                json.dump(st, f)
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-        # Normalize stray TRAINING states left from previous runs: if a status file
-        # claims "TRAINING" but no trainer is actually running in this GUI session,
-        # default it to NOT_TRAINED so BTC doesn't incorrectly show as training.
-        try:
-            for coin in self.coins:
-                try:
-                    coin_u = (coin or "").strip().upper()
-                    folder = self.coin_folders.get(coin_u) or self.project_dir
-                    status_path = os.path.join(folder, "trainer_status.json")
-                    st = _safe_read_json(status_path)
-                    if isinstance(st, dict) and str(st.get("state", "")).upper() == "TRAINING":
-                        try:
-                            _safe_write_json(status_path, {"state": "NOT_TRAINED"})
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        # Ensure initial trainer status files exist for each coin (default NOT_TRAINED), and
+        # normalize stray TRAINING states left from previous runs: if a status file claims
+        # "TRAINING" but no trainer is actually running in this GUI session, default it to
+        # NOT_TRAINED so BTC doesn't incorrectly show as training.
+        self._init_trainer_status_files(normalize_training=True)
 
 
         # scripts
@@ -1686,15 +1960,15 @@ class PowerTraderHub(tk.Tk):
         self.proc_trainer_path = os.path.abspath(os.path.join(self.project_dir, self.settings["script_neural_trainer"]))
 
         # live log queues
-        self.runner_log_q: "queue.Queue[str]" = queue.Queue()
-        self.trader_log_q: "queue.Queue[str]" = queue.Queue()
+        # Log pipes: one reader thread appends, the Tk loop pops (deque ops are atomic,
+        # no lock/condition per item); maxlen drops the oldest output instead of
+        # letting an unattended log grow without bound.
+        self.runner_log_q: "Deque[str]" = collections.deque(maxlen=LOG_QUEUE_MAXLEN)
+        self.trader_log_q: "Deque[str]" = collections.deque(maxlen=LOG_QUEUE_MAXLEN)
 
         # trainers: coin -> LogProc
         self.trainers: Dict[str, LogProc] = {}
 
-        self.fetcher = CandleFetcher()
-
-
         self.fetcher = CandleFetcher()
 
         self._build_menu()
@@ -1716,6 +1990,9 @@ class PowerTraderHub(tk.Tk):
 
         self.after(250, self._tick)
 
+        # Start the training queue checker
+        self._schedule_training_queue_check(1000)
+
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
 
@@ -1730,24 +2007,15 @@ class PowerTraderHub(tk.Tk):
             pass
 
         # Defaults for classic Tk widgets (Text/Listbox/Menu) created later
+        # (one Tcl eval for the whole option database instead of one round-trip per entry)
         try:
-            self.option_add("*Text.background", DARK_PANEL)
-            self.option_add("*Text.foreground", DARK_FG)
-            self.option_add("*Text.insertBackground", DARK_FG)
-            self.option_add("*Text.selectBackground", DARK_SELECT_BG)
-            self.option_add("*Text.selectForeground", DARK_SELECT_FG)
-
-            self.option_add("*Listbox.background", DARK_PANEL)
-            self.option_add("*Listbox.foreground", DARK_FG)
-            self.option_add("*Listbox.selectBackground", DARK_SELECT_BG)
-            self.option_add("*Listbox.selectForeground", DARK_SELECT_FG)
-
-            self.option_add("*Menu.background", DARK_BG2)
-            self.option_add("*Menu.foreground", DARK_FG)
-            self.option_add("*Menu.activeBackground", DARK_SELECT_BG)
-            self.option_add("*Menu.activeForeground", DARK_SELECT_FG)
+            self.tk.eval("\n".join(f"option add {{{pattern}}} {{{value}}}" for pattern, value in _DARK_OPTION_DB))
         except Exception:
-            pass
+            for pattern, value in _DARK_OPTION_DB:
+                try:
+                    self.option_add(pattern, value)
+                except Exception:
+                    pass
 
         style = ttk.Style(self)
 
@@ -1884,21 +2152,21 @@ class PowerTraderHub(tk.Tk):
 
             # Wrapping chart-tab buttons (normal + selected)
             style.configure(
-                "ChartTab.TButton",
+                _CHART_TAB_STYLE,
                 background=DARK_BG2,
                 foreground=DARK_FG,
                 bordercolor=DARK_BORDER,
                 padding=(10, 6),
             )
             style.map(
-                "ChartTab.TButton",
+                _CHART_TAB_STYLE,
                 background=[("active", DARK_PANEL2), ("pressed", DARK_PANEL)],
                 foreground=[("active", DARK_ACCENT2)],
                 bordercolor=[("active", DARK_ACCENT2), ("focus", DARK_ACCENT)],
             )
 
             style.configure(
-                "ChartTabSelected.TButton",
+                _CHART_TAB_SELECTED_STYLE,
                 background=DARK_PANEL,
                 foreground=DARK_ACCENT,
                 bordercolor=DARK_ACCENT2,
@@ -1971,15 +2239,54 @@ class PowerTraderHub(tk.Tk):
     def _settings_getter(self) -> dict:
         return self.settings
 
+    def _init_trainer_status_files(self, normalize_training: bool = False) -> None:
+        """
+        Single pass over the coins: create a missing trainer_status.json (NOT_TRAINED) and,
+        if normalize_training, reset a leftover TRAINING state to NOT_TRAINED.
+        Each status file is stat'ed once, read at most once and written at most once.
+        """
+        for coin in self.coins:
+            try:
+                coin_u = (coin or "").strip().upper()
+                folder = self.coin_folders.get(coin_u) or self.coin_folders.get(coin) or self.project_dir
+                if not folder:
+                    continue
+                status_path = os.path.join(folder, "trainer_status.json")
+                if not os.path.isfile(status_path):
+                    try:
+                        os.makedirs(folder, exist_ok=True)
+                    except Exception:
+                        pass
+                    _safe_write_json(status_path, {"state": "NOT_TRAINED"})
+                elif normalize_training:
+                    st = _safe_read_json(status_path)
+                    if isinstance(st, dict) and str(st.get("state", "")).upper() == "TRAINING":
+                        _safe_write_json(status_path, {"state": "NOT_TRAINED"})
+            except Exception:
+                pass
+
     def _ensure_alt_coin_folders_on_startup(self) -> None:
         """
         Ensure all alt coin folders exist (no trainer copy needed).
         """
+        # One readdir per parent folder instead of a stat per coin.
+        existing: Dict[str, set] = {}
         for coin in self.coins:
             if coin == "BTC":
                 continue
             folder = self.coin_folders.get(coin, None)
-            if folder and not os.path.isdir(folder):
+            if not folder:
+                continue
+            parent, name = os.path.split(os.path.normpath(folder))
+            names = existing.get(parent)
+            if names is None:
+                try:
+                    with os.scandir(parent) as it:
+                        names = {e.name for e in it if e.is_dir()}
+                except OSError:
+                    names = set()
+                existing[parent] = names
+            if name not in names:
                 try:
                     os.makedirs(folder, exist_ok=True)
                 except Exception:
@@ -1989,24 +2296,9 @@ class PowerTraderHub(tk.Tk):
 
 
     def _build_menu(self) -> None:
-        menubar = tk.Menu(
-            self,
-            bg=DARK_BG2,
-            fg=DARK_FG,
-            activebackground=DARK_SELECT_BG,
-            activeforeground=DARK_SELECT_FG,
-            bd=0,
-            relief="flat",
-        )
+        menubar = tk.Menu(self, bd=0, relief="flat", **_DARK_MENU_KW)
 
-        m_scripts = tk.Menu(
-            menubar,
-            tearoff=0,
-            bg=DARK_BG2,
-            fg=DARK_FG,
-            activebackground=DARK_SELECT_BG,
-            activeforeground=DARK_SELECT_FG,
-        )
+        m_scripts = tk.Menu(menubar, **_DARK_SUBMENU_KW)
         m_scripts.add_command(label="Start All", command=self.start_all_scripts)
         m_scripts.add_command(label="Stop All", command=self.stop_all_scripts)
         # Training-specific actions
@@ -2021,26 +2313,12 @@ class PowerTraderHub(tk.Tk):
         m_scripts.add_command(label="Stop Trader", command=self.stop_trader)
         menubar.add_cascade(label="Scripts", menu=m_scripts)
 
-        m_settings = tk.Menu(
-            menubar,
-            tearoff=0,
-            bg=DARK_BG2,
-            fg=DARK_FG,
-            activebackground=DARK_SELECT_BG,
-            activeforeground=DARK_SELECT_FG,
-        )
+        m_settings = tk.Menu(menubar, **_DARK_SUBMENU_KW)
         m_settings.add_command(label="General Settings...", command=self.open_settings_dialog)
         m_settings.add_command(label="Platform Settings...", command=self.open_platform_settings_dialog)
         menubar.add_cascade(label="Settings", menu=m_settings)
 
-        m_file = tk.Menu(
-            menubar,
-            tearoff=0,
-            bg=DARK_BG2,
-            fg=DARK_FG,
-            activebackground=DARK_SELECT_BG,
-            activeforeground=DARK_SELECT_FG,
-        )
+        m_file = tk.Menu(menubar, **_DARK_SUBMENU_KW)
         m_file.add_command(label="Exit", command=self._on_close)
         menubar.add_cascade(label="File", menu=m_file)
 
@@ -2080,60 +2358,31 @@ class PowerTraderHub(tk.Tk):
         self._pw_right_split = right_split
 
         # Clamp panes when the user releases a sash or the window resizes
-        outer.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_outer))
+        outer.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_outer, self._CONFIGURE_CLAMP_MS))
         outer.bind("<ButtonRelease-1>", lambda e: (
             setattr(self, "_user_moved_outer", True),
             self._schedule_paned_clamp(self._pw_outer),
         ))
 
-        left_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_left_split))
+        left_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_left_split, self._CONFIGURE_CLAMP_MS))
         left_split.bind("<ButtonRelease-1>", lambda e: (
             setattr(self, "_user_moved_left_split", True),
             self._schedule_paned_clamp(self._pw_left_split),
         ))
 
-        right_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_right_split))
+        right_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_right_split, self._CONFIGURE_CLAMP_MS))
         right_split.bind("<ButtonRelease-1>", lambda e: (
             setattr(self, "_user_moved_right_split", True),
             self._schedule_paned_clamp(self._pw_right_split),
         ))
 
         # Set a startup default width that matches the screenshot (so left has room for Neural Levels).
-        def _init_outer_sash_once():
-            try:
-                if getattr(self, "_did_init_outer_sash", False):
-                    return
-
-                # If the user already moved it, never override it.
-                if getattr(self, "_user_moved_outer", False):
-                    self._did_init_outer_sash = True
-                    return
-
-                total = outer.winfo_width()
-                if total <= 2:
-                    self.after(10, _init_outer_sash_once)
-                    return
-
-                min_left = 360
-                min_right = 520
-                desired_left = 470  # ~matches your screenshot
-                target = max(min_left, min(total - min_right, desired_left))
-                outer.sashpos(0, int(target))
-
-                self._did_init_outer_sash = True
-            except Exception:
-                pass
-
-        self.after_idle(_init_outer_sash_once)
+        # (min left 360, min right 520, desired left ~470 to match the screenshot)
+        self._init_sash_default(outer, "outer", 360, 520, 470)
 
         # Global safety: on some themes/platforms, the mouse events land on the sash element,
         # not the panedwindow widget, so the widget-level binds won't always fire.
-        self.bind_all("<ButtonRelease-1>", lambda e: (
-            self._schedule_paned_clamp(getattr(self, "_pw_outer", None)),
-            self._schedule_paned_clamp(getattr(self, "_pw_left_split", None)),
-            self._schedule_paned_clamp(getattr(self, "_pw_right_split", None)),
-            self._schedule_paned_clamp(getattr(self, "_pw_right_bottom_split", None)),
-        ))
+        self.bind_all("<ButtonRelease-1>", lambda e: self._schedule_all_paned_clamps())
 
 
         # ----------------------------
@@ -2216,22 +2465,46 @@ class PowerTraderHub(tk.Tk):
         btn_inner = ttk.Frame(btn_canvas)
         _btn_inner_id = btn_canvas.create_window((0, 0), window=btn_inner, anchor="nw")
 
+        # <Configure> fires in bursts while resizing (and our own canvas.configure
+        # calls re-fire it), so coalesce to one update per idle cycle.
+        self._btn_scroll_pending = False
+        self._btn_canvas_last_h = 1  # matches height=1 above
+        self._btn_inner_h = 0  # inner frame height as of its last <Configure>
+        self._btn_scroll_x_shown = False
+        self._btn_scroll_y_shown = False
+
         def _btn_update_scrollbars(event=None):
+            if self._btn_scroll_pending:
+                return
+            self._btn_scroll_pending = True
+            try:
+                self.after_idle(_run_btn_scroll_update)
+            except Exception:
+                self._btn_scroll_pending = False
+
+        def _run_btn_scroll_update():
+            self._btn_scroll_pending = False
+            _do_btn_update_scrollbars()
+
+        def _do_btn_update_scrollbars():
             try:
-                # Always keep scrollregion accurate
-                btn_canvas.configure(scrollregion=btn_canvas.bbox("all"))
-                sr = btn_canvas.bbox("all")
+                # Always keep scrollregion accurate (the inner window is the canvas's only
+                # item, so its bbox is the scrollregion; one query instead of two "all" walks)
+                sr = btn_canvas.bbox(_btn_inner_id)
                 if not sr:
                     return
+                btn_canvas.configure(scrollregion=sr)
 
                 # --- KEY FIX ---
                 # Resize the canvas height to the buttons' requested height so there is no
                 # dead/empty gap above the horizontal scrollbar.
+                # Compare against the height we last applied, not cget("height"), so we
+                # only reconfigure (and re-fire <Configure>) on a real change.
                 try:
-                    desired_h = max(1, int(btn_inner.winfo_reqheight()))
-                    cur_h = int(btn_canvas.cget("height") or 0)
-                    if cur_h != desired_h:
+                    desired_h = max(1, self._btn_inner_h)
+                    if self._btn_canvas_last_h != desired_h:
                         btn_canvas.configure(height=desired_h)
+                        self._btn_canvas_last_h = desired_h
                 except Exception:
                     pass
 
@@ -2242,17 +2515,22 @@ class PowerTraderHub(tk.Tk):
                 need_x = (x1 - x0) > (cw + 1)
                 need_y = (y1 - y0) > (ch + 1)
 
-                if need_x:
-                    btn_scroll_x.grid()
-                else:
-                    btn_scroll_x.grid_remove()
-                    btn_canvas.xview_moveto(0)
+                # Only touch the grid on show/hide transitions.
+                if need_x != self._btn_scroll_x_shown:
+                    self._btn_scroll_x_shown = need_x
+                    if need_x:
+                        btn_scroll_x.grid()
+                    else:
+                        btn_scroll_x.grid_remove()
+                        btn_canvas.xview_moveto(0)
 
-                if need_y:
-                    btn_scroll_y.grid()
-                else:
-                    btn_scroll_y.grid_remove()
-                    btn_canvas.yview_moveto(0)
+                if need_y != self._btn_scroll_y_shown:
+                    self._btn_scroll_y_shown = need_y
+                    if need_y:
+                        btn_scroll_y.grid()
+                    else:
+                        btn_scroll_y.grid_remove()
+                        btn_canvas.yview_moveto(0)
             except Exception:
                 pass
 
@@ -2265,7 +2543,13 @@ class PowerTraderHub(tk.Tk):
                 pass
             _btn_update_scrollbars()
 
-        btn_inner.bind("<Configure>", _btn_update_scrollbars)
+        def _btn_inner_on_configure(e):
+            # The canvas window item has no fixed height, so the inner frame is laid out
+            # at its requested height; remember it instead of asking winfo_reqheight().
+            self._btn_inner_h = int(e.height)
+            _btn_update_scrollbars()
+
+        btn_inner.bind("<Configure>", _btn_inner_on_configure)
         btn_canvas.bind("<Configure>", _btn_canvas_on_configure)
 
         # The original button layout (unchanged), placed inside the scrollable inner frame.
@@ -2284,8 +2568,17 @@ class PowerTraderHub(tk.Tk):
         train_group.grid(row=0, column=0, sticky="w", padx=(0, 18), pady=(0, 6))
 
 
-        # One more pass after layout so scrollbars reflect the true initial size.
-        self.after_idle(_btn_update_scrollbars)
+        # One more pass once the bar is actually mapped, so scrollbars reflect the true
+        # initial size (an after_idle here ran before the window had real geometry).
+        # Ongoing resizes are handled by the <Configure> binds above.
+        def _btn_on_first_map(_e=None):
+            try:
+                btn_canvas.unbind("<Map>")
+            except Exception:
+                pass
+            _btn_update_scrollbars()
+
+        btn_canvas.bind("<Map>", _btn_on_first_map)
 
 
 
@@ -2440,37 +2733,68 @@ class PowerTraderHub(tk.Tk):
             anchor="nw",
         )
 
+        # Canvas height as of the last <Configure> (avoids a winfo_height() round-trip per update)
+        self._neural_overview_canvas_h = 1
+        self._neural_wrap_applied_w = -1
+
+        self._neural_scroll_pending = False
+        self._neural_scroll_shown: Optional[bool] = None  # unknown until the first update
+
         def _update_neural_overview_scrollbars(event=None) -> None:
+            """Schedule one scrollbar update for the next idle cycle (coalesces <Configure> bursts)."""
+            if self._neural_scroll_pending:
+                return
+            self._neural_scroll_pending = True
+            try:
+                self.after_idle(_do_neural_scroll_update)
+            except Exception:
+                self._neural_scroll_pending = False
+
+        def _do_neural_scroll_update() -> None:
             """Update scrollregion + hide/show the scrollbar depending on overflow."""
+            self._neural_scroll_pending = False
             try:
                 c = self._neural_overview_canvas
                 win = self._neural_overview_window
 
-                c.update_idletasks()
+                # No update_idletasks() here: by the time an idle callback runs the pending
+                # geometry has been applied, and forcing a flush re-fired <Configure>.
                 bbox = c.bbox(win)
                 if not bbox:
-                    self._neural_overview_scroll.grid_remove()
+                    if self._neural_scroll_shown is not False:
+                        self._neural_overview_scroll.grid_remove()
+                        self._neural_scroll_shown = False
                     return
 
                 c.configure(scrollregion=bbox)
                 content_h = int(bbox[3] - bbox[1])
-                view_h = int(c.winfo_height())
-
-                if content_h > (view_h + 1):
-                    self._neural_overview_scroll.grid()
-                else:
-                    self._neural_overview_scroll.grid_remove()
-                    try:
-                        c.yview_moveto(0)
-                    except Exception:
-                        pass
+                view_h = self._neural_overview_canvas_h
+
+                # Only touch the grid on show/hide transitions.
+                should_show = content_h > (view_h + 1)
+                if should_show != self._neural_scroll_shown:
+                    self._neural_scroll_shown = should_show
+                    if should_show:
+                        self._neural_overview_scroll.grid()
+                    else:
+                        self._neural_overview_scroll.grid_remove()
+                        try:
+                            c.yview_moveto(0)
+                        except Exception:
+                            pass
             except Exception:
                 pass
 
         def _on_neural_canvas_configure(e) -> None:
             # Keep the inner wrap frame exactly the canvas width so wrapping is correct.
+            # Only resize the window item on a real width change; itemconfigure
+            # re-fires the WrapFrame's <Configure> (and a reflow) even when equal.
             try:
-                self._neural_overview_canvas.itemconfigure(self._neural_overview_window, width=int(e.width))
+                self._neural_overview_canvas_h = int(e.height)
+                w = int(e.width)
+                if w != self._neural_wrap_applied_w:
+                    self._neural_overview_canvas.itemconfigure(self._neural_overview_window, width=w)
+                    self._neural_wrap_applied_w = w
             except Exception:
                 pass
             _update_neural_overview_scrollbars()
@@ -2479,11 +2803,30 @@ class PowerTraderHub(tk.Tk):
         self.neural_wrap.bind("<Configure>", _update_neural_overview_scrollbars, add="+")
         self._update_neural_overview_scrollbars = _update_neural_overview_scrollbars
 
-        # Mousewheel scroll inside the tiles area
+        # Mousewheel scroll inside the tiles area.
+        # Trackpads can fire wheel events faster than the tiles repaint, so accumulate
+        # units and apply them in one yview_scroll per idle cycle.
+        self._wheel_pending_units = 0
+        self._wheel_flush_scheduled = False
+
+        def _flush_wheel():
+            self._wheel_flush_scheduled = False
+            units, self._wheel_pending_units = self._wheel_pending_units, 0
+            try:
+                if units:
+                    self._neural_overview_canvas.yview_scroll(units, "units")
+            except Exception:
+                pass
+
         def _wheel(e):
             try:
-                if self._neural_overview_scroll.winfo_ismapped():
-                    self._neural_overview_canvas.yview_scroll(int(-1 * (e.delta / 120)), "units")
+                # (scrollbar visibility is tracked by the scroll updater; no winfo round-trip)
+                if not self._neural_scroll_shown:
+                    return
+                self._wheel_pending_units += int(-1 * (e.delta / 120))
+                if not self._wheel_flush_scheduled:
+                    self._wheel_flush_scheduled = True
+                    self.after_idle(_flush_wheel)
             except Exception:
                 pass
 
@@ -2492,14 +2835,20 @@ class PowerTraderHub(tk.Tk):
 
         # tiles by coin
         self.neural_tiles: Dict[str, NeuralSignalTile] = {}
-        # small cache: path -> (mtime, value)
-        self._neural_overview_cache: Dict[str, Tuple[float, Any]] = {}
+        # small cache: path -> ((mtime_ns, size), value)
+        self._neural_overview_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
 
         self._rebuild_neural_overview()
-        try:
-            self.after_idle(self._update_neural_overview_scrollbars)
-        except Exception:
-            pass
+
+        # Initial scrollbar pass when the tile canvas is first mapped (see the controls bar).
+        def _neural_on_first_map(_e=None):
+            try:
+                self._neural_overview_canvas.unbind("<Map>")
+            except Exception:
+                pass
+            self._update_neural_overview_scrollbars()
+
+        self._neural_overview_canvas.bind("<Map>", _neural_on_first_map)
 
 
 
@@ -2643,60 +2992,31 @@ class PowerTraderHub(tk.Tk):
         self._pw_right_split = right_split
 
         # Clamp panes when the user releases a sash or the window resizes
-        outer.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_outer))
+        outer.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_outer, self._CONFIGURE_CLAMP_MS))
         outer.bind("<ButtonRelease-1>", lambda e: (
             setattr(self, "_user_moved_outer", True),
             self._schedule_paned_clamp(self._pw_outer),
         ))
 
-        left_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_left_split))
+        left_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_left_split, self._CONFIGURE_CLAMP_MS))
         left_split.bind("<ButtonRelease-1>", lambda e: (
             setattr(self, "_user_moved_left_split", True),
             self._schedule_paned_clamp(self._pw_left_split),
         ))
 
-        right_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_right_split))
+        right_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_right_split, self._CONFIGURE_CLAMP_MS))
         right_split.bind("<ButtonRelease-1>", lambda e: (
             setattr(self, "_user_moved_right_split", True),
             self._schedule_paned_clamp(self._pw_right_split),
         ))
 
         # Set a startup default width that matches the screenshot (so left has room for Neural Levels).
-        def _init_outer_sash_once():
-            try:
-                if getattr(self, "_did_init_outer_sash", False):
-                    return
-
-                # If the user already moved it, never override it.
-                if getattr(self, "_user_moved_outer", False):
-                    self._did_init_outer_sash = True
-                    return
-
-                total = outer.winfo_width()
-                if total <= 2:
-                    self.after(10, _init_outer_sash_once)
-                    return
-
-                min_left = 360
-                min_right = 520
-                desired_left = 470  # ~matches your screenshot
-                target = max(min_left, min(total - min_right, desired_left))
-                outer.sashpos(0, int(target))
-
-                self._did_init_outer_sash = True
-            except Exception:
-                pass
-
-        self.after_idle(_init_outer_sash_once)
+        # (min left 360, min right 520, desired left ~470 to match the screenshot)
+        self._init_sash_default(outer, "outer", 360, 520, 470)
 
         # Global safety: on some themes/platforms, the mouse events land on the sash element,
         # not the panedwindow widget, so the widget-level binds won't always fire.
-        self.bind_all("<ButtonRelease-1>", lambda e: (
-            self._schedule_paned_clamp(getattr(self, "_pw_outer", None)),
-            self._schedule_paned_clamp(getattr(self, "_pw_left_split", None)),
-            self._schedule_paned_clamp(getattr(self, "_pw_right_split", None)),
-            self._schedule_paned_clamp(getattr(self, "_pw_right_bottom_split", None)),
-        ))
+        self.bind_all("<ButtonRelease-1>", lambda e: self._schedule_all_paned_clamps())
 
 
         # ----------------------------
@@ -2705,82 +3025,24 @@ class PowerTraderHub(tk.Tk):
         charts_frame = ttk.LabelFrame(right_split, text="Charts (Neural lines overlaid)")
         self._charts_frame = charts_frame
 
-        # Multi-row "tabs" (WrapFrame)
-        self.chart_tabs_bar = WrapFrame(charts_frame)
-        # Keep left padding, remove right padding so tabs can reach the edge
-        self.chart_tabs_bar.pack(fill="x", padx=(6, 0), pady=(6, 0))
-
-        # Page container (no ttk.Notebook, so there are NO native tabs to show)
-        self.chart_pages_container = ttk.Frame(charts_frame)
-        # Keep left padding, remove right padding so charts fill to the edge
-        self.chart_pages_container.pack(fill="both", expand=True, padx=(6, 0), pady=(0, 6))
-
-
-        self._chart_tab_buttons: Dict[str, ttk.Button] = {}
-        self.chart_pages: Dict[str, ttk.Frame] = {}
-        self._current_chart_page: str = "ACCOUNT"
-
-        def _show_page(name: str) -> None:
-            self._current_chart_page = name
-            # hide all pages
-            for f in self.chart_pages.values():
-                try:
-                    f.pack_forget()
-                except Exception:
-                    pass
-            # show selected
-            f = self.chart_pages.get(name)
-            if f is not None:
-                f.pack(fill="both", expand=True)
-
-            # style selected tab
-            for txt, b in self._chart_tab_buttons.items():
-                try:
-                    b.configure(style=("ChartTabSelected.TButton" if txt == name else "ChartTab.TButton"))
-                except Exception:
-                    pass
-
-            # Immediately refresh the newly shown coin chart so candles appear right away
-            # (even if trader/neural scripts are not running yet).
-            try:
-                tab = str(name or "").strip().upper()
-                if tab and tab != "ACCOUNT":
-                    coin = tab
-                    chart = self.charts.get(coin)
-                    if chart:
-                        def _do_refresh_visible():
-                            try:
-                                # Ensure coin folders exist (best-effort; fast)
-                                try:
-                                    cf_sig = (self.settings.get("main_neural_dir"), tuple(self.coins))
-                                    if getattr(self, "_coin_folders_sig", None) != cf_sig:
-                                        self._coin_folders_sig = cf_sig
-                                        self.coin_folders = build_coin_folders(self.settings["main_neural_dir"], self.coins)
-                                except Exception:
-                                    pass
-
-                                pos = self._last_positions.get(coin, {}) if isinstance(self._last_positions, dict) else {}
-                                buy_px = pos.get("current_buy_price", None)
-                                sell_px = pos.get("current_sell_price", None)
-                                trail_line = pos.get("trail_line", None)
-                                dca_line_price = pos.get("dca_line_price", None)
-
-                                chart.refresh(
-                                    self.coin_folders,
-                                    current_buy_price=buy_px,
-                                    current_sell_price=sell_px,
-                                    trail_line=trail_line,
-                                    dca_line_price=dca_line_price,
-                                )
-                            except Exception:
-                                pass
+        # Multi-row "tabs" (WrapFrame)
+        self.chart_tabs_bar = WrapFrame(charts_frame)
+        # Keep left padding, remove right padding so tabs can reach the edge
+        self.chart_tabs_bar.pack(fill="x", padx=(6, 0), pady=(6, 0))
 
-                        self.after(1, _do_refresh_visible)
-            except Exception:
-                pass
+        # Page container (no ttk.Notebook, so there are NO native tabs to show)
+        self.chart_pages_container = ttk.Frame(charts_frame)
+        # Keep left padding, remove right padding so charts fill to the edge
+        self.chart_pages_container.pack(fill="both", expand=True, padx=(6, 0), pady=(0, 6))
+        # Pages share one grid cell; switching is grid_remove()/grid() (see _show_chart_page)
+        self.chart_pages_container.grid_rowconfigure(0, weight=1)
+        self.chart_pages_container.grid_columnconfigure(0, weight=1)
 
 
-        self._show_chart_page = _show_page  # used by _rebuild_coin_chart_tabs()
+        self._chart_tab_buttons: Dict[str, ttk.Button] = {}
+        self.chart_pages: Dict[str, ttk.Frame] = {}
+        self._current_chart_page: str = "ACCOUNT"
+        self._chart_page_shown: Optional[str] = None  # page currently gridded (None = none yet)
 
         # ACCOUNT page
         acct_page = ttk.Frame(self.chart_pages_container)
@@ -2789,7 +3051,7 @@ class PowerTraderHub(tk.Tk):
         acct_btn = ttk.Button(
             self.chart_tabs_bar,
             text="ACCOUNT",
-            style="ChartTab.TButton",
+            style=_CHART_TAB_STYLE,
             command=lambda: self._show_chart_page("ACCOUNT"),
         )
         self.chart_tabs_bar.add(acct_btn, padx=(0, 6), pady=(0, 6))
@@ -2811,15 +3073,12 @@ class PowerTraderHub(tk.Tk):
             btn = ttk.Button(
                 self.chart_tabs_bar,
                 text=coin,
-                style="ChartTab.TButton",
-                command=lambda c=coin: self._show_chart_page(c),
+                style=_CHART_TAB_STYLE,
+                command=functools.partial(self._show_chart_page, coin),
             )
             self.chart_tabs_bar.add(btn, padx=(0, 6), pady=(0, 6))
             self._chart_tab_buttons[coin] = btn
-
-            chart = CandleChart(page, self.fetcher, coin, self._settings_getter, self.trade_history_path)
-            chart.pack(fill="both", expand=True)
-            self.charts[coin] = chart
+            # (the CandleChart itself is built on first show; see _ensure_chart)
 
         # show initial page
         self._show_chart_page("ACCOUNT")
@@ -2834,7 +3093,7 @@ class PowerTraderHub(tk.Tk):
         right_bottom_split = ttk.Panedwindow(right_split, orient="vertical")
         self._pw_right_bottom_split = right_bottom_split
 
-        right_bottom_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_right_bottom_split))
+        right_bottom_split.bind("<Configure>", lambda e: self._schedule_paned_clamp(self._pw_right_bottom_split, self._CONFIGURE_CLAMP_MS))
         right_bottom_split.bind("<ButtonRelease-1>", lambda e: (
             setattr(self, "_user_moved_right_bottom_split", True),
             self._schedule_paned_clamp(self._pw_right_bottom_split),
@@ -2882,64 +3141,82 @@ class PowerTraderHub(tk.Tk):
             show="headings",
             height=10
         )
+        # Reasonable starting widths (they will be dynamically scaled on resize)
         for c in cols:
             self.trades_tree.heading(c, text=header_labels.get(c, c))
-            self.trades_tree.column(c, width=110, anchor="center", stretch=True)
-
-        # Reasonable starting widths (they will be dynamically scaled on resize)
-        self.trades_tree.column("coin", width=70)
-        self.trades_tree.column("qty", width=95)
-        self.trades_tree.column("value", width=110)
-        self.trades_tree.column("next_dca", width=160)
-        self.trades_tree.column("dca_stages", width=90)
-        self.trades_tree.column("dca_24h", width=80)
+            self.trades_tree.column(c, width=_TRADES_BASE_WIDTHS.get(c, 110), anchor="center", stretch=True)
 
         ysb = ttk.Scrollbar(trades_table_wrap, orient="vertical", command=self.trades_tree.yview)
         xsb = ttk.Scrollbar(trades_table_wrap, orient="horizontal", command=self.trades_tree.xview)
         self.trades_tree.configure(yscrollcommand=ysb.set, xscrollcommand=xsb.set)
 
         self.trades_tree.pack(side="top", fill="both", expand=True)
+        # iid (coin) -> row values last written (see _refresh_trader_status)
+        self._trades_row_values: Dict[str, tuple] = {}
         xsb.pack(side="bottom", fill="x")
         ysb.pack(side="right", fill="y")
 
+        base_total = sum(_TRADES_BASE_WIDTHS.get(c, 110) for c in cols) or 1
+        self._last_trades_avail = -1
+        self._last_trades_col_widths: Dict[str, int] = {}
+        # Tree width from the latest <Configure> and the (fixed) scrollbar width, so a
+        # resize doesn't need winfo_width() round-trips for either.
+        self._trades_tree_w = 0
+        self._trades_sb_w = 0
+
         def _resize_trades_columns(*_):
             # Scale the initial column widths proportionally so the table always fits the current window.
-            try:
-                total_w = int(self.trades_tree.winfo_width())
-            except Exception:
-                return
+            total_w = self._trades_tree_w
             if total_w <= 1:
-                return
+                try:
+                    total_w = int(self.trades_tree.winfo_width())
+                except Exception:
+                    return
+                if total_w <= 1:
+                    return
 
-            try:
-                sb_w = int(ysb.winfo_width() or 0)
-            except Exception:
-                sb_w = 0
+            sb_w = self._trades_sb_w
+            if sb_w <= 1:
+                try:
+                    sb_w = int(ysb.winfo_width() or 0)
+                except Exception:
+                    sb_w = 0
+                if sb_w > 1:
+                    self._trades_sb_w = sb_w
 
             avail = max(200, total_w - sb_w - 8)
+            if abs(avail - self._last_trades_avail) < 2:
+                return
+            self._last_trades_avail = avail
 
-            base = {
-                "coin": 70,
-                "qty": 95,
-                "value": 110,
-                "avg_cost": 110,
-                "buy_price": 110,
-                "buy_pnl": 110,
-                "sell_price": 110,
-                "sell_pnl": 110,
-                "dca_stages": 90,
-                "dca_24h": 80,
-                "next_dca": 160,
-                "trail_line": 110,
-            }
-            base_total = sum(base.get(c, 110) for c in cols) or 1
             scale = avail / base_total
 
+            last_w = self._last_trades_col_widths
             for c in cols:
-                w = int(base.get(c, 110) * scale)
-                self.trades_tree.column(c, width=max(60, min(420, w)))
+                w = max(60, min(420, int(_TRADES_BASE_WIDTHS.get(c, 110) * scale)))
+                if last_w.get(c) != w:
+                    self.trades_tree.column(c, width=w)
+                    last_w[c] = w
+
+        # <Configure> arrives in bursts while dragging; throttle to one resize per ~frame.
+        # Events while a resize is pending only record their width, so the pending run
+        # uses the newest width and columns keep tracking a continuous drag.
+        self._trades_resize_after_id: Optional[str] = None
 
-        self.trades_tree.bind("<Configure>", lambda e: self.after_idle(_resize_trades_columns))
+        def _run_trades_resize():
+            self._trades_resize_after_id = None
+            _resize_trades_columns()
+
+        def _schedule_trades_resize(e=None):
+            try:
+                self._trades_tree_w = int(e.width)
+            except Exception:
+                pass
+            if self._trades_resize_after_id is not None:
+                return
+            self._trades_resize_after_id = self.after(16, _run_trades_resize)
+
+        self.trades_tree.bind("<Configure>", _schedule_trades_resize)
         self.after_idle(_resize_trades_columns)
 
 
@@ -2990,80 +3267,207 @@ class PowerTraderHub(tk.Tk):
             pass
 
         # Startup defaults to match the screenshot (but never override if user already dragged).
-        def _init_right_split_sash_once():
-            try:
-                if getattr(self, "_did_init_right_split_sash", False):
-                    return
+        # chart pane ~410px tall (min 360 / 220 below); Current Trades ~280px (min 140 / 120 below)
+        self._init_sash_default(right_split, "right_split", 360, 220, 410)
+        self._init_sash_default(right_bottom_split, "right_bottom_split", 140, 120, 280)
 
-                if getattr(self, "_user_moved_right_split", False):
-                    self._did_init_right_split_sash = True
-                    return
+        # All clamped panes in one tuple (read on every mouse release)
+        self._pane_minsize_cache.clear()  # minsizes were (re)configured above
+        self._panes = tuple(pw for pw in (getattr(self, attr, None) for attr in self._PANE_ATTRS) if pw is not None)
 
-                total = right_split.winfo_height()
-                if total <= 2:
-                    self.after(10, _init_right_split_sash_once)
-                    return
+        # Initial clamp once everything is laid out
+        self.after_idle(self._schedule_all_paned_clamps)
 
-                min_top = 360
-                min_bottom = 220
-                desired_top = 410  # ~matches screenshot chart pane height
-                target = max(min_top, min(total - min_bottom, desired_top))
-                right_split.sashpos(0, int(target))
-                self._did_init_right_split_sash = True
-            except Exception:
-                pass
 
-        def _init_right_bottom_split_sash_once():
+        # status bar
+        self.status = ttk.Label(self, text="Ready", anchor="w")
+        self.status.pack(fill="x", side="bottom")
+
+
+
+    def _show_chart_page(self, name: str) -> None:
+        """Switch the Charts area to `name` ("ACCOUNT" or a coin)."""
+        prev = self._chart_page_shown
+        if name == prev:
+            return
+        self._current_chart_page = name
+        self._chart_page_shown = name
+
+        # Only the previously shown page is gridded; swap just that one.
+        # (grid_remove keeps the page's grid slot, so re-showing it is cheap)
+        if prev is not None:
+            f = self.chart_pages.get(prev)
+            if f is not None:
+                try:
+                    f.grid_remove()
+                except Exception:
+                    pass
+        f = self.chart_pages.get(name)
+        if f is not None:
+            f.grid(row=0, column=0, sticky="nsew")
+
+        # style selected tab (only the two buttons whose state changed)
+        for txt, style in ((prev, _CHART_TAB_STYLE), (name, _CHART_TAB_SELECTED_STYLE)):
+            b = self._chart_tab_buttons.get(txt) if txt is not None else None
+            if b is not None:
+                try:
+                    b.configure(style=style)
+                except Exception:
+                    pass
+
+        # Immediately refresh the newly shown coin chart so candles appear right away
+        # (even if trader/neural scripts are not running yet).
+        try:
+            tab = str(name or "").strip().upper()
+            if tab and tab != "ACCOUNT":
+                coin = tab
+                chart = self._ensure_chart(coin)
+                if chart:
+                    if coin in self._pending_chart_refresh:
+                        return
+                    self._pending_chart_refresh.add(coin)
+
+                    def _do_refresh_visible():
+                        self._pending_chart_refresh.discard(coin)
+                        try:
+                            # Ensure coin folders exist (best-effort; fast)
+                            try:
+                                cf_sig = (self.settings.get("main_neural_dir"), tuple(self.coins))
+                                if getattr(self, "_coin_folders_sig", None) != cf_sig:
+                                    self._coin_folders_sig = cf_sig
+                                    self.coin_folders = build_coin_folders(self.settings["main_neural_dir"], self.coins)
+                            except Exception:
+                                pass
+
+                            pos = self._last_positions.get(coin, {}) if isinstance(self._last_positions, dict) else {}
+                            buy_px = pos.get("current_buy_price", None)
+                            sell_px = pos.get("current_sell_price", None)
+                            trail_line = pos.get("trail_line", None)
+                            dca_line_price = pos.get("dca_line_price", None)
+
+                            # Flipping back to a chart drawn moments ago with the same inputs:
+                            # keep what's on screen (candles are refetched once the normal
+                            # chart_refresh_seconds window has passed).
+                            sig = (getattr(self, "_coin_folders_sig", None), buy_px, sell_px, trail_line, dca_line_price)
+                            now = time.time()
+                            hit = self._last_refresh_sig.get(coin)
+                            if hit and hit[0] == sig and (now - hit[1]) < float(self.settings.get("chart_refresh_seconds", 10.0)):
+                                return
+                            self._last_refresh_sig[coin] = (sig, now)
+
+                            chart.refresh(
+                                self.coin_folders,
+                                current_buy_price=buy_px,
+                                current_sell_price=sell_px,
+                                trail_line=trail_line,
+                                dca_line_price=dca_line_price,
+                            )
+                        except Exception:
+                            pass
+
+                    # after_idle (not after(1)): runs once pending Tk work is done, and the
+                    # pending set above keeps rapid tab switching from stacking refreshes.
+                    self.after_idle(_do_refresh_visible)
+        except Exception:
+            pass
+
+    def _ensure_chart(self, coin: str) -> Optional["CandleChart"]:
+        """
+        Return the CandleChart for `coin`, building it on first use.
+
+        Each chart is a full matplotlib Figure + Tk canvas, so we only pay for the
+        coins the user actually opens instead of every coin at startup.
+        """
+        chart = self.charts.get(coin)
+        if chart is None:
+            page = self.chart_pages.get(coin)
+            if page is None:
+                return None
+            chart = CandleChart(page, self.fetcher, coin, self._settings_getter, self.trade_history_path)
+            chart.pack(fill="both", expand=True)
+            self.charts[coin] = chart
+            self._last_refresh_sig.pop(coin, None)  # a fresh chart has nothing drawn yet
+        return chart
+
+    # ---- panedwindow anti-collapse helpers ----
+
+    def _init_sash_default(self, pw: ttk.Panedwindow, name: str, min_first: int, min_second: int, desired_first: int) -> None:
+        """
+        One-shot startup position for sash 0 of `pw`, once it has a real size.
+
+        Uses the `_did_init_<name>_sash` / `_user_moved_<name>` flags, so it never
+        overrides a sash the user already dragged.
+        """
+        did_attr = f"_did_init_{name}_sash"
+        moved_attr = f"_user_moved_{name}"
+
+        def _apply():
             try:
-                if getattr(self, "_did_init_right_bottom_split_sash", False):
+                if getattr(self, did_attr, False):
                     return
 
-                if getattr(self, "_user_moved_right_bottom_split", False):
-                    self._did_init_right_bottom_split_sash = True
+                # If the user already moved it, never override it.
+                if getattr(self, moved_attr, False):
+                    setattr(self, did_attr, True)
                     return
 
-                total = right_bottom_split.winfo_height()
+                total = pw.winfo_height() if str(pw.cget("orient")) == "vertical" else pw.winfo_width()
                 if total <= 2:
-                    self.after(10, _init_right_bottom_split_sash_once)
                     return
 
-                min_top = 140
-                min_bottom = 120
-                desired_top = 280  # more space for Current Trades (like screenshot)
-                target = max(min_top, min(total - min_bottom, desired_top))
-
-                right_bottom_split.sashpos(0, int(target))
-                self._did_init_right_bottom_split_sash = True
+                target = max(min_first, min(total - min_second, desired_first))
+                pw.sashpos(0, int(target))
+                setattr(self, did_attr, True)
             except Exception:
                 pass
 
-        self.after_idle(_init_right_split_sash_once)
-        self.after_idle(_init_right_bottom_split_sash_once)
+        self.after_idle(lambda: self._call_when_sized(pw, _apply))
 
-        # Initial clamp once everything is laid out
-        self.after_idle(lambda: (
-            self._schedule_paned_clamp(getattr(self, "_pw_outer", None)),
-            self._schedule_paned_clamp(getattr(self, "_pw_left_split", None)),
-            self._schedule_paned_clamp(getattr(self, "_pw_right_split", None)),
-            self._schedule_paned_clamp(getattr(self, "_pw_right_bottom_split", None)),
-        ))
+    def _call_when_sized(self, widget, fn: Callable[[], None]) -> None:
+        """
+        Run fn once `widget` has a real (> 2px) size.
 
+        If it isn't laid out yet, wait for its first real <Configure> instead of
+        re-polling with after(10, ...). The one-shot binding lives on a private
+        bindtag so removing it doesn't touch the widget's own <Configure> binds.
+        """
+        try:
+            if widget.winfo_width() > 2 and widget.winfo_height() > 2:
+                fn()
+                return
 
-        # status bar
-        self.status = ttk.Label(self, text="Ready", anchor="w")
-        self.status.pack(fill="x", side="bottom")
+            tag = f"pt_when_sized_{id(fn)}"
 
+            def _on_configure(e):
+                if e.width <= 2 or e.height <= 2:
+                    return
+                try:
+                    widget.bindtags(tuple(t for t in widget.bindtags() if t != tag))
+                    self.unbind_class(tag, "<Configure>")
+                except Exception:
+                    pass
+                fn()
 
+            self.bind_class(tag, "<Configure>", _on_configure)
+            widget.bindtags(widget.bindtags() + (tag,))
+        except Exception:
+            pass
 
-    # ---- panedwindow anti-collapse helpers ----
+    def _schedule_all_paned_clamps(self) -> None:
+        for pw in self._panes:
+            self._schedule_paned_clamp(pw)
 
-    def _schedule_paned_clamp(self, pw: ttk.Panedwindow) -> None:
+    def _schedule_paned_clamp(self, pw: ttk.Panedwindow, delay_ms: int = 1) -> None:
         """
         Debounced clamp so we don't fight the geometry manager mid-resize.
 
         IMPORTANT: use `after(1, ...)` instead of `after_idle(...)` so it still runs
         while the mouse is held during sash dragging (Tk often doesn't go "idle"
         until after the drag ends, which is exactly when panes can vanish).
+
+        <Configure> binds pass a longer delay: a window drag fires one event per
+        pixel, and the pending timer swallows the rest, so the clamp runs at most
+        once per delay_ms while resizing (it reads live sizes when it runs).
         """
         try:
             if not pw or not int(pw.winfo_exists()):
@@ -3083,7 +3487,7 @@ class PowerTraderHub(tk.Tk):
             self._clamp_panedwindow_sashes(pw)
 
         try:
-            self._paned_clamp_after_ids[key] = self.after(1, _run)
+            self._paned_clamp_after_ids[key] = self.after(delay_ms, _run)
         except Exception:
             pass
 
@@ -3110,7 +3514,16 @@ class PowerTraderHub(tk.Tk):
             if total <= 2:
                 return
 
+            # Minsizes are set once in _build_layout, so the paneconfigure round-trip
+            # (and its parsing) is cached per (panedwindow, pane).
+            cache = self._pane_minsize_cache
+            pw_key = str(pw)
+
             def _get_minsize(pane_id) -> int:
+                key = (pw_key, str(pane_id))
+                v = cache.get(key)
+                if v is not None:
+                    return v
                 try:
                     cfg = pw.paneconfigure(pane_id)
                     ms = cfg.get("minsize", 0)
@@ -3120,9 +3533,11 @@ class PowerTraderHub(tk.Tk):
                         ms = ms[-1]
 
                     # sometimes it's already int/float-like, sometimes it's a string
-                    return max(0, int(float(ms)))
+                    v = max(0, int(float(ms)))
                 except Exception:
                     return 0
+                cache[key] = v
+                return v
 
             mins: List[int] = [_get_minsize(p) for p in panes]
 
@@ -3137,53 +3552,81 @@ class PowerTraderHub(tk.Tk):
                 if sum(mins) >= total:
                     return
 
-            # Two-pass clamp so constraints settle even with multiple sashes
-            for _ in range(2):
-                for i in range(len(panes) - 1):
-                    min_pos = sum(mins[: i + 1])
-                    max_pos = total - sum(mins[i + 1 :])
+            # Each sash's bounds depend only on the minsizes (not on the other sashes),
+            # so a single pass over prefix sums settles every constraint.
+            prefix = list(itertools.accumulate(mins))
+            total_min = prefix[-1]
+            for i in range(len(panes) - 1):
+                min_pos = prefix[i]
+                max_pos = total - (total_min - prefix[i])
+
+                try:
+                    cur = int(pw.sashpos(i))
+                except Exception:
+                    continue
 
+                new = max(min_pos, min(max_pos, cur))
+                if new != cur:
                     try:
-                        cur = int(pw.sashpos(i))
+                        pw.sashpos(i, new)
                     except Exception:
-                        continue
-
-                    new = max(min_pos, min(max_pos, cur))
-                    if new != cur:
-                        try:
-                            pw.sashpos(i, new)
-                        except Exception:
-                            pass
-
+                        pass
 
         except Exception:
             pass
 
-
-
-        # Start the training queue checker
-        self.after(1000, self._check_training_queue)
-
     # ---- process control ----
 
 
-    def _reader_thread(self, proc: subprocess.Popen, q: "queue.Queue[str]", prefix: str) -> None:
+    def _reader_thread(
+        self,
+        proc: subprocess.Popen,
+        q: "Deque[str]",
+        prefix: str,
+        ready_event: Optional[threading.Event] = None,
+    ) -> None:
+        # Read the raw pipe in chunks: os.read blocks until *some* output is available
+        # (or EOF), so there's no poll/sleep loop, and a burst of lines costs one read
+        # instead of one readline() each. Newlines are normalized like text mode did
+        # (\r\n and bare \r both end a line; a \r at a chunk edge may pair with \n).
         try:
-            # line-buffered text mode
+            fd = proc.stdout.fileno() if proc.stdout else None
+            if fd is None:
+                return
+            decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+            partial = ""
+            pending_cr = False
             while True:
-                line = proc.stdout.readline() if proc.stdout else ""
-                if not line:
-                    if proc.poll() is not None:
-                        break
-                    time.sleep(0.05)
-                    continue
-                q.put(f"{prefix}{line.rstrip()}")
+                data = os.read(fd, 65536)
+                text = decoder.decode(data, final=not data)
+                if pending_cr and text.startswith("\n"):
+                    text = text[1:]
+                pending_cr = text.endswith("\r")
+                parts = (partial + text).replace("\r\n", "\n").replace("\r", "\n").split("\n")
+                partial = parts.pop()
+                if parts:
+                    if ready_event is not None and not ready_event.is_set():
+                        if any(line.startswith(RUNNER_READY_MARKER) for line in parts):
+                            ready_event.set()
+                    # One append per chunk (not one per line);
+                    # _drain_queue_to_text joins items with "\n" so a block reads the same.
+                    q.append("\n".join(f"{prefix}{line.rstrip()}" for line in parts))
+                if not data:
+                    if partial:
+                        q.append(f"{prefix}{partial.rstrip()}")
+                    break
         except Exception:
             pass
         finally:
-            q.put(f"{prefix}[process exited]")
+            q.append(f"{prefix}[process exited]")
 
-    def _start_process(self, p: ProcInfo, log_q: Optional["queue.Queue[str]"] = None, prefix: str = "") -> None:
+    def _start_process(
+        self,
+        p: ProcInfo,
+        log_q: Optional["Deque[str]"] = None,
+        prefix: str = "",
+        ready_event: Optional[threading.Event] = None,
+    ) -> None:
         if p.proc and p.proc.poll() is None:
             return
         if not os.path.isfile(p.path):
@@ -3200,8 +3643,7 @@ class PowerTraderHub(tk.Tk):
                 env=env,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                bufsize=0,  # raw pipe; _reader_thread decodes/splits lines itself
             )
             # record launch time for uptime display
             try:
@@ -3209,7 +3651,7 @@ class PowerTraderHub(tk.Tk):
             except Exception:
                 p.start_time = None
             if log_q is not None:
-                t = threading.Thread(target=self._reader_thread, args=(p.proc, log_q, prefix), daemon=True)
+                t = threading.Thread(target=self._reader_thread, args=(p.proc, log_q, prefix, ready_event), daemon=True)
                 t.start()
         except Exception as e:
             messagebox.showerror("Failed to start", f"{p.name} failed to start:\n{e}")
@@ -3228,10 +3670,10 @@ class PowerTraderHub(tk.Tk):
             pass
 
     def start_neural(self) -> None:
-        # Reset runner-ready gate file (prevents stale "ready" from a prior run)
+        # Reset runner-ready gate (event + file; prevents stale "ready" from a prior run)
+        self.runner_ready_event.clear()
         try:
-            with open(self.runner_ready_path, "w", encoding="utf-8") as f:
-                json.dump({"timestamp": time.time(), "ready": False, "stage": "starting"}, f)
+            _safe_write_json(self.runner_ready_path, {"timestamp": time.time(), "ready": False, "stage": "starting"})
         except Exception:
             pass
 
@@ -3243,7 +3685,12 @@ class PowerTraderHub(tk.Tk):
         except Exception:
             pass
 
-        self._start_process(self.proc_neural, log_q=self.runner_log_q, prefix="[RUNNER] ")
+        self._start_process(
+            self.proc_neural,
+            log_q=self.runner_log_q,
+            prefix="[RUNNER] ",
+            ready_event=self.runner_ready_event,
+        )
 
 
     def start_trader(self) -> None:
@@ -3291,8 +3738,16 @@ class PowerTraderHub(tk.Tk):
             self._auto_start_trader_pending = False
             return
 
-        st = self._read_runner_ready()
-        if bool(st.get("ready", False)):
+        # The runner prints RUNNER_READY_MARKER when it's ready (seen by its reader thread);
+        # the gate file is only a fallback, re-read on a backoff (100ms, 150ms, ... capped at 1s).
+        ready = self.runner_ready_event.is_set()
+        if not ready:
+            now = time.monotonic()
+            if now >= self._runner_ready_file_next:
+                ready = bool(self._read_runner_ready().get("ready", False))
+                self._runner_ready_file_next = now + self._runner_ready_file_delay
+                self._runner_ready_file_delay = min(1.0, self._runner_ready_file_delay * 1.5)
+        if ready:
             self._auto_start_trader_pending = False
 
             # Start trader if not already running
@@ -3302,7 +3757,7 @@ class PowerTraderHub(tk.Tk):
 
         # Not ready yet — keep polling
         try:
-            self.after(250, self._poll_runner_ready_then_start_trader)
+            self.after(50, self._poll_runner_ready_then_start_trader)
         except Exception:
             pass
 
@@ -3320,8 +3775,10 @@ class PowerTraderHub(tk.Tk):
         self.start_neural()
 
         # Wait for runner to signal readiness before starting trader
+        self._runner_ready_file_delay = 0.1
+        self._runner_ready_file_next = time.monotonic() + self._runner_ready_file_delay
         try:
-            self.after(250, self._poll_runner_ready_then_start_trader)
+            self.after(50, self._poll_runner_ready_then_start_trader)
         except Exception:
             pass
 
@@ -3329,29 +3786,53 @@ class PowerTraderHub(tk.Tk):
     def _coin_is_trained(self, coin: str) -> bool:
         coin = coin.upper().strip()
         folder = self.coin_folders.get(coin, "")
-        if not folder or not os.path.isdir(folder):
+        if not folder:
             return False
 
-        # If trainer reports it's currently training, it's not "trained" yet.
-        try:
-            st = _safe_read_json(os.path.join(folder, "trainer_status.json"))
-            if isinstance(st, dict) and str(st.get("state", "")).upper() == "TRAINING":
-                return False
-        except Exception:
-            pass
-
+        status_path = os.path.join(folder, "trainer_status.json")
         stamp_path = os.path.join(folder, "trainer_last_training_time.txt")
+
+        # One stat per file; the JSON/stamp are only re-read when either file changed.
+        # (A missing folder just means a missing stamp.)
+        stamp_sig = _file_sig(stamp_path)
+        if stamp_sig is None:
+            return False
+        key = (folder, _file_sig(status_path), stamp_sig)
+
+        hit = self._trained_cache.get(coin)
+        if hit is not None and hit[0] == key:
+            training, ts = hit[1], hit[2]
+        else:
+            # If trainer reports it's currently training, it's not "trained" yet.
+            training = key[1] is not None and self._trainer_state(status_path, key[1]) == "TRAINING"
+
+            try:
+                with open(stamp_path, "r", encoding="utf-8") as f:
+                    raw = (f.read() or "").strip()
+                ts = float(raw) if raw else 0.0
+            except Exception:
+                ts = 0.0
+            self._trained_cache[coin] = (key, training, ts)
+
+        if training or ts <= 0:
+            return False
+        # the 14-day window is checked live (only the file contents are cached)
+        return (time.time() - ts) <= (14 * 24 * 60 * 60)
+
+    def _trainer_state(self, status_path: str, sig: Tuple[int, int]) -> str:
+        """Upper-cased "state" from a trainer_status.json, re-parsed only when `sig` changed."""
+        hit = self._trainer_state_cache.get(status_path)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        state = ""
         try:
-            if not os.path.isfile(stamp_path):
-                return False
-            with open(stamp_path, "r", encoding="utf-8") as f:
-                raw = (f.read() or "").strip()
-            ts = float(raw) if raw else 0.0
-            if ts <= 0:
-                return False
-            return (time.time() - ts) <= (14 * 24 * 60 * 60)
+            st = _safe_read_json(status_path)
+            if isinstance(st, dict):
+                state = str(st.get("state", "")).upper()
         except Exception:
-            return False
+            pass
+        self._trainer_state_cache[status_path] = (sig, state)
+        return state
 
     def _running_trainers(self) -> List[str]:
         running: List[str] = []
@@ -3369,21 +3850,20 @@ class PowerTraderHub(tk.Tk):
             try:
                 coin = (c or "").strip().upper()
                 folder = self.coin_folders.get(coin, "")
-                if not folder or not os.path.isdir(folder):
+                if not folder:
                     continue
 
+                # One stat per file (a missing folder is just a missing status file);
+                # the status JSON is only re-parsed when it changed.
                 status_path = os.path.join(folder, "trainer_status.json")
-                st = _safe_read_json(status_path)
-
-                if isinstance(st, dict) and str(st.get("state", "")).upper() == "TRAINING":
-                    stamp_path = os.path.join(folder, "trainer_last_training_time.txt")
+                status_sig = _file_sig(status_path)
+                if status_sig is None:
+                    continue
 
-                    try:
-                        if os.path.isfile(stamp_path) and os.path.isfile(status_path):
-                            if os.path.getmtime(stamp_path) >= os.path.getmtime(status_path):
-                                continue
-                    except Exception:
-                        pass
+                if self._trainer_state(status_path, status_sig) == "TRAINING":
+                    stamp_sig = _file_sig(os.path.join(folder, "trainer_last_training_time.txt"))
+                    if stamp_sig is not None and stamp_sig[0] >= status_sig[0]:
+                        continue
 
                     running.append(coin)
             except Exception:
@@ -3470,10 +3950,7 @@ class PowerTraderHub(tk.Tk):
             self.status.config(text=f"Started training all {started} coins")
 
         # Always schedule the training queue checker so queued coins are started as soon as possible
-        try:
-            self.after(100, self._check_training_queue)
-        except Exception:
-            pass
+        self._schedule_training_queue_check(100)
 
     def start_trainer_for_selected_coin(self) -> None:
         coin = (self.trainer_coin_var.get() or "").strip().upper()
@@ -3499,27 +3976,29 @@ class PowerTraderHub(tk.Tk):
 
 
         try:
-            patterns = [
+            # One directory listing instead of a glob (listing + fnmatch) per pattern;
+            # the wildcard patterns are all "<prefix>*.txt".
+            fixed_names = {
                 "trainer_last_training_time.txt",
                 "trainer_status.json",
                 "trainer_last_start_time.txt",
                 "killer.txt",
-                "memories_*.txt",
-                "memory_weights_*.txt",
-                "neural_perfect_threshold_*.txt",
-            ]
-
+            }
+            prefixes = ("memories_", "memory_weights_", "neural_perfect_threshold_")
 
             deleted = 0
-            for pat in patterns:
-                for fp in glob.glob(os.path.join(coin_cwd, pat)):
-                    try:
-                        os.remove(fp)
-                        deleted += 1
-                    except Exception:
-                        pass
+            with os.scandir(coin_cwd) as it:
+                for entry in it:
+                    name = entry.name
+                    if name in fixed_names or (name.startswith(prefixes) and name.endswith(".txt")):
+                        try:
+                            os.remove(entry.path)
+                            deleted += 1
+                        except Exception:
+                            pass
 
             if deleted:
+                self._trained_cache.pop(coin, None)
                 try:
                     self.status.config(text=f"Deleted {deleted} training file(s) for {coin} before training")
                 except Exception:
@@ -3527,7 +4006,7 @@ class PowerTraderHub(tk.Tk):
         except Exception:
             pass
 
-        q: "queue.Queue[str]" = queue.Queue()
+        q: "Deque[str]" = collections.deque(maxlen=LOG_QUEUE_MAXLEN)
         info = ProcInfo(name=f"Trainer-{coin}", path=trainer_path)
 
         env = os.environ.copy()
@@ -3547,8 +4026,7 @@ class PowerTraderHub(tk.Tk):
                 env=env,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                bufsize=0,  # raw pipe; _reader_thread decodes/splits lines itself
             )
             t = threading.Thread(target=self._reader_thread, args=(info.proc, q, f"[{coin}] "), daemon=True)
             t.start()
@@ -3564,8 +4042,7 @@ class PowerTraderHub(tk.Tk):
                     "start_time": datetime.utcnow().isoformat() + "Z",
                 }
                 try:
-                    with open(status_path, "w", encoding="utf-8") as f:
-                        json.dump(st, f)
+                    _safe_write_json(status_path, st)
                 except Exception:
                     pass
             except Exception:
@@ -3604,8 +4081,7 @@ class PowerTraderHub(tk.Tk):
                 "stop_time": datetime.utcnow().isoformat() + "Z",
             }
             try:
-                with open(status_path, "w", encoding="utf-8") as f:
-                    json.dump(st, f)
+                _safe_write_json(status_path, st)
             except Exception:
                 pass
         except Exception:
@@ -3618,8 +4094,24 @@ class PowerTraderHub(tk.Tk):
             pass
 
 
+    def _schedule_training_queue_check(self, delay_ms: int = 5000) -> None:
+        """
+        Keep exactly one pending _check_training_queue timer.
+        Re-scheduling replaces the pending check instead of starting another 5s polling chain.
+        """
+        try:
+            if self._training_queue_after_id:
+                self.after_cancel(self._training_queue_after_id)
+        except Exception:
+            pass
+        try:
+            self._training_queue_after_id = self.after(delay_ms, self._check_training_queue)
+        except Exception:
+            self._training_queue_after_id = None
+
     def _check_training_queue(self) -> None:
         """Check if any trainings have completed and start queued ones."""
+        self._training_queue_after_id = None
         try:
             max_concurrent = int(self.settings.get("max_concurrent_trainings", 2))
             max_concurrent = max(1, min(max_concurrent, len(self.coins)))
@@ -3655,10 +4147,7 @@ class PowerTraderHub(tk.Tk):
             pass
 
         # Schedule next check
-        try:
-            self.after(5000, self._check_training_queue)  # Check every 5 seconds
-        except Exception:
-            pass
+        self._schedule_training_queue_check(5000)  # Check every 5 seconds
 
 
     def _coin_needs_training(self, coin: str) -> bool:
@@ -3703,8 +4192,7 @@ class PowerTraderHub(tk.Tk):
                                 "stop_time": datetime.utcnow().isoformat() + "Z",
                             }
                             try:
-                                with open(status_path, "w", encoding="utf-8") as f:
-                                    json.dump(st, f)
+                                _safe_write_json(status_path, st)
                             except Exception:
                                 pass
                         except Exception:
@@ -3750,8 +4238,7 @@ class PowerTraderHub(tk.Tk):
                                 "stop_time": datetime.utcnow().isoformat() + "Z",
                             }
                             try:
-                                with open(status_path, "w", encoding="utf-8") as f:
-                                    json.dump(st, f)
+                                _safe_write_json(status_path, st)
                             except Exception:
                                 pass
                         except Exception:
@@ -3770,8 +4257,7 @@ class PowerTraderHub(tk.Tk):
 
         # Also reset the runner-ready gate file (best-effort)
         try:
-            with open(self.runner_ready_path, "w", encoding="utf-8") as f:
-                json.dump({"timestamp": time.time(), "ready": False, "stage": "stopped"}, f)
+            _safe_write_json(self.runner_ready_path, {"timestamp": time.time(), "ready": False, "stage": "stopped"})
         except Exception:
             pass
 
@@ -3812,20 +4298,28 @@ class PowerTraderHub(tk.Tk):
             pass
 
     # ---- refresh loop ----
-    def _drain_queue_to_text(self, q: "queue.Queue[str]", txt: tk.Text, max_lines: int = 2500) -> None:
+    def _drain_queue_to_text(self, q: "Deque[str]", txt: tk.Text, max_lines: int = 2500) -> None:
 
+        # Collect everything queued since the last tick, then do a single Text insert
+        # (one Tcl call + one redraw instead of one per line).
+        lines: List[str] = []
         try:
-            changed = False
             while True:
-                line = q.get_nowait()
-                txt.insert("end", line + "\n")
-                changed = True
-        except queue.Empty:
+                lines.append(q.popleft())
+        except IndexError:
             pass
         except Exception:
             pass
 
-        if changed:
+        if lines:
+            # Items beyond the cap would be trimmed right back out; don't insert them.
+            # (An item may hold a whole chunk of lines; the trim below is the exact cap.)
+            if len(lines) > max_lines:
+                del lines[:-max_lines]
+            try:
+                txt.insert("end", "\n".join(lines) + "\n")
+            except Exception:
+                pass
             # trim very old lines
             try:
                 current = int(txt.index("end-1c").split(".")[0])
@@ -3875,11 +4369,12 @@ class PowerTraderHub(tk.Tk):
 
         # Start All is now a toggle (Start/Stop)
         try:
-            if hasattr(self, "btn_toggle_all") and self.btn_toggle_all:
+            btn = getattr(self, "btn_toggle_all", None)
+            if btn:
                 if neural_running or trader_running or bool(getattr(self, "_auto_start_trader_pending", False)):
-                    self.btn_toggle_all.config(text="Stop All")
+                    btn.config(text="Stop All")
                 else:
-                    self.btn_toggle_all.config(text="Start All")
+                    btn.config(text="Start All")
         except Exception:
             pass
 
@@ -3935,15 +4430,17 @@ class PowerTraderHub(tk.Tk):
                     except Exception:
                         percent = 0
                 percent_map[c] = percent
-            if hasattr(self, "train_all_progress_label"):
+            progress_label = getattr(self, "train_all_progress_label", None)
+            if progress_label is not None:
                 pct_str = "  ".join(f"{c}: {percent_map[c]}%" for c in self.coins)
-                self.train_all_progress_label.config(text=pct_str)
+                progress_label.config(text=pct_str)
             # Update overall progress bar
-            if hasattr(self, "train_all_progress"):
+            progress_bar = getattr(self, "train_all_progress", None)
+            if progress_bar is not None:
                 if total > 0:
-                    self.train_all_progress['value'] = int((sum(percent_map.values()) / (total * 100)) * 100)
+                    progress_bar['value'] = int((sum(percent_map.values()) / (total * 100)) * 100)
                 else:
-                    self.train_all_progress['value'] = 0
+                    progress_bar['value'] = 0
 
             # show each coin status (ONLY redraw the list if it actually changed)
             sig = tuple((c, status_map.get(c, "N/A")) for c in self.coins)
@@ -4012,8 +4509,9 @@ class PowerTraderHub(tk.Tk):
             # Fallback: old notebook-based UI (if it exists)
             if not selected_tab:
                 try:
-                    if hasattr(self, "nb") and self.nb:
-                        selected_tab = self.nb.tab(self.nb.select(), "text")
+                    nb = getattr(self, "nb", None)
+                    if nb:
+                        selected_tab = nb.tab(nb.select(), "text")
                 except Exception:
                     selected_tab = None
 
@@ -4026,6 +4524,10 @@ class PowerTraderHub(tk.Tk):
                     sell_px = pos.get("current_sell_price", None)
                     trail_line = pos.get("trail_line", None)
                     dca_line_price = pos.get("dca_line_price", None)
+                    self._last_refresh_sig[coin] = (
+                        (getattr(self, "_coin_folders_sig", None), buy_px, sell_px, trail_line, dca_line_price),
+                        now,
+                    )
                     try:
                         chart.refresh(
                             self.coin_folders,
@@ -4063,10 +4565,7 @@ class PowerTraderHub(tk.Tk):
 
     def _refresh_trader_status(self) -> None:
         # mtime cache: rebuilding the whole tree every tick is expensive with many rows
-        try:
-            mtime = os.path.getmtime(self.trader_status_path)
-        except Exception:
-            mtime = None
+        mtime = _file_sig(self.trader_status_path)
 
         if getattr(self, "_last_trader_status_mtime", object()) == mtime:
             return
@@ -4092,6 +4591,7 @@ class PowerTraderHub(tk.Tk):
             # clear tree (once; subsequent ticks are mtime-short-circuited)
             for iid in self.trades_tree.get_children():
                 self.trades_tree.delete(iid)
+            self._trades_row_values = {}
             return
 
 
@@ -4195,12 +4695,12 @@ class PowerTraderHub(tk.Tk):
 
             last_sell_ts: Dict[str, float] = {}
             for tr in trades:
-                sym = str(tr.get("symbol", "")).upper().strip()
+                sym = _norm_upper(str(tr.get("symbol", "")))
                 base = sym.split("-")[0].strip() if sym else ""
                 if not base:
                     continue
 
-                side = str(tr.get("side", "")).lower().strip()
+                side = _norm_lower(str(tr.get("side", "")))
                 if side != "sell":
                     continue
 
@@ -4214,16 +4714,16 @@ class PowerTraderHub(tk.Tk):
                     last_sell_ts[base] = tsf
 
             for tr in trades:
-                sym = str(tr.get("symbol", "")).upper().strip()
+                sym = _norm_upper(str(tr.get("symbol", "")))
                 base = sym.split("-")[0].strip() if sym else ""
                 if not base:
                     continue
 
-                side = str(tr.get("side", "")).lower().strip()
+                side = _norm_lower(str(tr.get("side", "")))
                 if side != "buy":
                     continue
 
-                tag = str(tr.get("tag") or "").upper().strip()
+                tag = _norm_upper(str(tr.get("tag") or ""))
                 if tag != "DCA":
                     continue
 
@@ -4238,9 +4738,10 @@ class PowerTraderHub(tk.Tk):
         except Exception:
             dca_24h_by_coin = {}
 
-        # rebuild tree (only when file changes)
-        for iid in self.trades_tree.get_children():
-            self.trades_tree.delete(iid)
+        # Update the tree in place (only when file changes): one row per coin, keyed by
+        # iid=coin, so unchanged rows cost nothing and the selection/scroll survive.
+        tree = self.trades_tree
+        rows: Dict[str, tuple] = {}
 
         for sym, pos in positions.items():
             coin = sym
@@ -4268,25 +4769,40 @@ class PowerTraderHub(tk.Tk):
 
             trail_line = pos.get("trail_line", 0.0)
 
-            self.trades_tree.insert(
-                "",
-                "end",
-                values=(
-                    coin,
-                    f"{qty:.8f}".rstrip("0").rstrip("."),
-                    _fmt_money(value),       # position value (USD)
-                    _fmt_price(avg_cost),    # per-unit price (USD) -> dynamic decimals
-                    _fmt_price(buy_price),
-                    _fmt_pct(buy_pnl),
-                    _fmt_price(sell_price),
-                    _fmt_pct(sell_pnl),
-                    dca_stages,
-                    dca_24h,
-                    next_dca,
-                    _fmt_price(trail_line),  # trail line is a price level
-                ),
+            values = (
+                coin,
+                f"{qty:.8f}".rstrip("0").rstrip("."),
+                _fmt_money(value),       # position value (USD)
+                _fmt_price(avg_cost),    # per-unit price (USD) -> dynamic decimals
+                _fmt_price(buy_price),
+                _fmt_pct(buy_pnl),
+                _fmt_price(sell_price),
+                _fmt_pct(sell_pnl),
+                dca_stages,
+                dca_24h,
+                next_dca,
+                _fmt_price(trail_line),  # trail line is a price level
             )
 
+            rows.setdefault(str(coin), values)
+
+        last = self._trades_row_values
+        present = set(tree.get_children())
+        stale = present.difference(rows)
+        if stale:
+            tree.delete(*stale)
+        for iid, values in rows.items():
+            if iid not in present:
+                tree.insert("", "end", iid=iid, values=values)
+            elif last.get(iid) != values:
+                tree.item(iid, values=values)
+        # keep positions-file order (moves only when the order actually changed)
+        order = list(rows)
+        if list(tree.get_children()) != order:
+            for idx, iid in enumerate(order):
+                tree.move(iid, "", idx)
+        self._trades_row_values = rows
+
 
 
 
@@ -4296,10 +4812,7 @@ class PowerTraderHub(tk.Tk):
 
     def _refresh_pnl(self) -> None:
         # mtime cache: avoid reading/parsing every tick
-        try:
-            mtime = os.path.getmtime(self.pnl_ledger_path)
-        except Exception:
-            mtime = None
+        mtime = _file_sig(self.pnl_ledger_path)
 
         if getattr(self, "_last_pnl_mtime", object()) == mtime:
             return
@@ -4315,10 +4828,7 @@ class PowerTraderHub(tk.Tk):
 
     def _refresh_trade_history(self) -> None:
         # mtime cache: avoid reading/parsing/rebuilding the list every tick
-        try:
-            mtime = os.path.getmtime(self.trade_history_path)
-        except Exception:
-            mtime = None
+        mtime = _file_sig(self.trade_history_path)
 
         if getattr(self, "_last_trade_history_mtime", object()) == mtime:
             return
@@ -4329,15 +4839,13 @@ class PowerTraderHub(tk.Tk):
             self.hist_list.insert("end", "(no trade_history.jsonl yet)")
             return
 
-        # show last N lines
+        # show last N lines (tail-read: the log is append-only and grows all session)
         try:
-            with open(self.trade_history_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            lines = _tail_lines(self.trade_history_path, 250)  # cap for UI
         except Exception:
             return
 
-        lines = lines[-250:]  # cap for UI
-        self.hist_list.delete(0, "end")
+        items: List[str] = []
         for line in reversed(lines):
             line = line.strip()
             if not line:
@@ -4385,9 +4893,14 @@ class PowerTraderHub(tk.Tk):
                     except Exception:
                         txt += f" | realized={pnl}"
 
-                self.hist_list.insert("end", txt)
+                items.append(txt)
             except Exception:
-                self.hist_list.insert("end", line)
+                items.append(line)
+
+        # one delete + one insert instead of a Listbox call per row
+        self.hist_list.delete(0, "end")
+        if items:
+            self.hist_list.insert("end", *items)
 
 
 
@@ -4406,54 +4919,39 @@ class PowerTraderHub(tk.Tk):
         # Refresh coin dropdowns (they don't auto-update)
         try:
             # Training pane dropdown
-            if hasattr(self, "train_coin_combo") and self.train_coin_combo.winfo_exists():
-                self.train_coin_combo["values"] = self.coins
-                cur = (self.train_coin_var.get() or "").strip().upper() if hasattr(self, "train_coin_var") else ""
+            train_combo = getattr(self, "train_coin_combo", None)
+            train_var = getattr(self, "train_coin_var", None)
+            trainer_combo = getattr(self, "trainer_coin_combo", None)
+            trainer_var = getattr(self, "trainer_coin_var", None)
+
+            if train_combo is not None and train_combo.winfo_exists():
+                train_combo["values"] = self.coins
+                cur = (train_var.get() or "").strip().upper() if train_var is not None else ""
                 if self.coins and cur not in self.coins:
-                    self.train_coin_var.set(self.coins[0])
+                    train_var.set(self.coins[0])
 
             # Trainers tab dropdown
-            if hasattr(self, "trainer_coin_combo") and self.trainer_coin_combo.winfo_exists():
-                self.trainer_coin_combo["values"] = self.coins
-                cur = (self.trainer_coin_var.get() or "").strip().upper() if hasattr(self, "trainer_coin_var") else ""
+            if trainer_combo is not None and trainer_combo.winfo_exists():
+                trainer_combo["values"] = self.coins
+                cur = (trainer_var.get() or "").strip().upper() if trainer_var is not None else ""
                 if self.coins and cur not in self.coins:
-                    self.trainer_coin_var.set(self.coins[0])
+                    trainer_var.set(self.coins[0])
 
             # Keep both selectors aligned if both exist
-            if hasattr(self, "train_coin_var") and hasattr(self, "trainer_coin_var"):
-                if self.train_coin_var.get():
-                    self.trainer_coin_var.set(self.train_coin_var.get())
+            if train_var is not None and trainer_var is not None:
+                sel = train_var.get()
+                if sel:
+                    trainer_var.set(sel)
         except Exception:
             pass
 
         # Ensure each coin has an initial trainer_status.json; default to NOT_TRAINED when missing
-        try:
-            for coin in self.coins:
-                try:
-                    coin_u = (coin or "").strip().upper()
-                    folder = self.coin_folders.get(coin_u) or self.coin_folders.get(coin) or self.project_dir
-                    if not folder:
-                        continue
-                    status_path = os.path.join(folder, "trainer_status.json")
-                    if not os.path.isfile(status_path):
-                        st = {"state": "NOT_TRAINED"}
-                        try:
-                            os.makedirs(folder, exist_ok=True)
-                        except Exception:
-                            pass
-                        try:
-                            with open(status_path, "w", encoding="utf-8") as f:
-                                json.dump(st, f)
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        self._init_trainer_status_files()
 
         # Rebuild neural overview tiles (if the widget exists)
         try:
-            if hasattr(self, "neural_wrap") and self.neural_wrap.winfo_exists():
+            wrap = getattr(self, "neural_wrap", None)
+            if wrap is not None and wrap.winfo_exists():
                 self._rebuild_neural_overview()
                 self._refresh_neural_overview()
         except Exception:
@@ -4474,15 +4972,17 @@ class PowerTraderHub(tk.Tk):
         Uses WrapFrame so it automatically breaks into multiple rows.
         Adds hover highlighting and click-to-open chart.
         """
-        if not hasattr(self, "neural_wrap") or self.neural_wrap is None:
+        wrap = getattr(self, "neural_wrap", None)
+        if wrap is None:
             return
 
         # Clear old tiles
         try:
-            if hasattr(self.neural_wrap, "clear"):
-                self.neural_wrap.clear(destroy_widgets=True)
+            clear = getattr(wrap, "clear", None)
+            if clear is not None:
+                clear(destroy_widgets=True)
             else:
-                for ch in list(self.neural_wrap.winfo_children()):
+                for ch in list(wrap.winfo_children()):
                     ch.destroy()
         except Exception:
             pass
@@ -4577,24 +5077,28 @@ class PowerTraderHub(tk.Tk):
             if getattr(self, "_coin_folders_sig", None) != sig:
                 self._coin_folders_sig = sig
                 self.coin_folders = build_coin_folders(self.settings.get("main_neural_dir") or self.project_dir, self.coins)
+                # Paths may have moved; drop entries for folders/coins we no longer read.
+                self._neural_overview_cache = {}
         except Exception:
             pass
 
         if not hasattr(self, "_neural_overview_cache"):
-            self._neural_overview_cache = {}  # path -> (mtime, value)
+            self._neural_overview_cache = {}  # path -> ((mtime_ns, size), value)
 
         def _cached(path: str, loader, default: Any):
-            try:
-                mtime = os.path.getmtime(path)
-            except Exception:
+            # One stat per file: a missing file returns (default, None), so callers
+            # don't need a separate isfile() check first.
+            fsig = _file_sig(path)
+            if fsig is None:
                 return default, None
+            mtime = fsig[0] / 1e9
 
             hit = self._neural_overview_cache.get(path)
-            if hit and hit[0] == mtime:
+            if hit and hit[0] == fsig:
                 return hit[1], mtime
 
             v = loader(path)
-            self._neural_overview_cache[path] = (mtime, v)
+            self._neural_overview_cache[path] = (fsig, v)
             return v, mtime
 
         def _load_short_from_memory_json(path: str) -> int:
@@ -4622,24 +5126,16 @@ class PowerTraderHub(tk.Tk):
             mt_candidates: List[float] = []
 
             # Long signal
-            long_path = os.path.join(folder, "long_dca_signal.txt")
-            if os.path.isfile(long_path):
-                long_sig, mt = _cached(long_path, read_int_from_file, 0)
-                if mt:
-                    mt_candidates.append(float(mt))
+            long_sig, mt = _cached(os.path.join(folder, "long_dca_signal.txt"), read_int_from_file, 0)
+            if mt:
+                mt_candidates.append(mt)
 
             # Short signal (prefer txt; fallback to memory.json)
-            short_txt = os.path.join(folder, "short_dca_signal.txt")
-            if os.path.isfile(short_txt):
-                short_sig, mt = _cached(short_txt, read_int_from_file, 0)
-                if mt:
-                    mt_candidates.append(float(mt))
-            else:
-                mem = os.path.join(folder, "memory.json")
-                if os.path.isfile(mem):
-                    short_sig, mt = _cached(mem, _load_short_from_memory_json, 0)
-                    if mt:
-                        mt_candidates.append(float(mt))
+            short_sig, mt = _cached(os.path.join(folder, "short_dca_signal.txt"), read_int_from_file, 0)
+            if mt is None:
+                short_sig, mt = _cached(os.path.join(folder, "memory.json"), _load_short_from_memory_json, 0)
+            if mt:
+                mt_candidates.append(mt)
 
             tile.set_values(long_sig, short_sig)
 
@@ -4649,13 +5145,14 @@ class PowerTraderHub(tk.Tk):
 
         # Update "Last:" label
         try:
-            if hasattr(self, "lbl_neural_overview_last") and self.lbl_neural_overview_last.winfo_exists():
+            lbl_last = getattr(self, "lbl_neural_overview_last", None)
+            if lbl_last is not None and lbl_last.winfo_exists():
                 if latest_ts:
-                    self.lbl_neural_overview_last.config(
+                    lbl_last.config(
                         text=f"Last: {time.strftime('%H:%M:%S', time.localtime(float(latest_ts)))}"
                     )
                 else:
-                    self.lbl_neural_overview_last.config(text="Last: N/A")
+                    lbl_last.config(text="Last: N/A")
         except Exception:
             pass
 
@@ -4677,14 +5174,16 @@ class PowerTraderHub(tk.Tk):
 
         # Destroy existing tab bar + pages container (clean rebuild)
         try:
-            if hasattr(self, "chart_tabs_bar") and self.chart_tabs_bar.winfo_exists():
-                self.chart_tabs_bar.destroy()
+            bar = getattr(self, "chart_tabs_bar", None)
+            if bar is not None and bar.winfo_exists():
+                bar.destroy()
         except Exception:
             pass
 
         try:
-            if hasattr(self, "chart_pages_container") and self.chart_pages_container.winfo_exists():
-                self.chart_pages_container.destroy()
+            container = getattr(self, "chart_pages_container", None)
+            if container is not None and container.winfo_exists():
+                container.destroy()
         except Exception:
             pass
 
@@ -4694,72 +5193,14 @@ class PowerTraderHub(tk.Tk):
 
         self.chart_pages_container = ttk.Frame(charts_frame)
         self.chart_pages_container.pack(fill="both", expand=True, padx=6, pady=(0, 6))
+        # Pages share one grid cell; switching is grid_remove()/grid() (see _show_chart_page)
+        self.chart_pages_container.grid_rowconfigure(0, weight=1)
+        self.chart_pages_container.grid_columnconfigure(0, weight=1)
 
         self._chart_tab_buttons = {}
         self.chart_pages = {}
         self._current_chart_page = selected
-
-        def _show_page(name: str) -> None:
-            self._current_chart_page = name
-            # hide all pages
-            for f in self.chart_pages.values():
-                try:
-                    f.pack_forget()
-                except Exception:
-                    pass
-            # show selected
-            f = self.chart_pages.get(name)
-            if f is not None:
-                f.pack(fill="both", expand=True)
-
-            # style selected tab
-            for txt, b in self._chart_tab_buttons.items():
-                try:
-                    b.configure(style=("ChartTabSelected.TButton" if txt == name else "ChartTab.TButton"))
-                except Exception:
-                    pass
-
-            # Immediately refresh the newly shown coin chart so candles appear right away
-            # (even if trader/neural scripts are not running yet).
-            try:
-                tab = str(name or "").strip().upper()
-                if tab and tab != "ACCOUNT":
-                    coin = tab
-                    chart = self.charts.get(coin)
-                    if chart:
-                        def _do_refresh_visible():
-                            try:
-                                # Ensure coin folders exist (best-effort; fast)
-                                try:
-                                    cf_sig = (self.settings.get("main_neural_dir"), tuple(self.coins))
-                                    if getattr(self, "_coin_folders_sig", None) != cf_sig:
-                                        self._coin_folders_sig = cf_sig
-                                        self.coin_folders = build_coin_folders(self.settings["main_neural_dir"], self.coins)
-                                except Exception:
-                                    pass
-
-                                pos = self._last_positions.get(coin, {}) if isinstance(self._last_positions, dict) else {}
-                                buy_px = pos.get("current_buy_price", None)
-                                sell_px = pos.get("current_sell_price", None)
-                                trail_line = pos.get("trail_line", None)
-                                dca_line_price = pos.get("dca_line_price", None)
-
-                                chart.refresh(
-                                    self.coin_folders,
-                                    current_buy_price=buy_px,
-                                    current_sell_price=sell_px,
-                                    trail_line=trail_line,
-                                    dca_line_price=dca_line_price,
-                                )
-                            except Exception:
-                                pass
-
-                        self.after(1, _do_refresh_visible)
-            except Exception:
-                pass
-
-
-        self._show_chart_page = _show_page  # used by _rebuild_coin_chart_tabs()
+        self._chart_page_shown = None
 
         # ACCOUNT page
         acct_page = ttk.Frame(self.chart_pages_container)
@@ -4768,7 +5209,7 @@ class PowerTraderHub(tk.Tk):
         acct_btn = ttk.Button(
             self.chart_tabs_bar,
             text="ACCOUNT",
-            style="ChartTab.TButton",
+            style=_CHART_TAB_STYLE,
             command=lambda: self._show_chart_page("ACCOUNT"),
         )
         self.chart_tabs_bar.add(acct_btn, padx=(0, 6), pady=(0, 6))
@@ -4790,15 +5231,12 @@ class PowerTraderHub(tk.Tk):
             btn = ttk.Button(
                 self.chart_tabs_bar,
                 text=coin,
-                style="ChartTab.TButton",
-                command=lambda c=coin: self._show_chart_page(c),
+                style=_CHART_TAB_STYLE,
+                command=functools.partial(self._show_chart_page, coin),
             )
             self.chart_tabs_bar.add(btn, padx=(0, 6), pady=(0, 6))
             self._chart_tab_buttons[coin] = btn
-
-            chart = CandleChart(page, self.fetcher, coin, self._settings_getter, self.trade_history_path)
-            chart.pack(fill="both", expand=True)
-            self.charts[coin] = chart
+            # (the CandleChart itself is built on first show; see _ensure_chart)
 
         # show initial page
         self._show_chart_page("ACCOUNT")
@@ -4889,17 +5327,10 @@ class PowerTraderHub(tk.Tk):
         frm.bind("<Configure>", _update_settings_scrollbars, add="+")
 
         # Mousewheel scrolling when the mouse is over the settings window.
-        def _wheel(e):
-            try:
-                if settings_scroll.winfo_ismapped():
-                    settings_canvas.yview_scroll(int(-1 * (e.delta / 120)), "units")
-            except Exception:
-                pass
-
         settings_canvas.bind("<Enter>", lambda _e: settings_canvas.focus_set(), add="+")
-        settings_canvas.bind("<MouseWheel>", _wheel, add="+")  # Windows / Mac
-        settings_canvas.bind("<Button-4>", lambda _e: settings_canvas.yview_scroll(-3, "units"), add="+")  # Linux
-        settings_canvas.bind("<Button-5>", lambda _e: settings_canvas.yview_scroll(3, "units"), add="+")   # Linux
+        settings_canvas.bind("<MouseWheel>", _canvas_wheel, add="+")  # Windows / Mac
+        settings_canvas.bind("<Button-4>", _canvas_wheel, add="+")  # Linux
+        settings_canvas.bind("<Button-5>", _canvas_wheel, add="+")  # Linux
 
 
 
@@ -5115,17 +5546,10 @@ class PowerTraderHub(tk.Tk):
         frm.bind("<Configure>", _update_settings_scrollbars, add="+")
 
         # Mousewheel scrolling when the mouse is over the settings window.
-        def _wheel(e):
-            try:
-                if settings_scroll.winfo_ismapped():
-                    settings_canvas.yview_scroll(int(-1 * (e.delta / 120)), "units")
-            except Exception:
-                pass
-
         settings_canvas.bind("<Enter>", lambda _e: settings_canvas.focus_set(), add="+")
-        settings_canvas.bind("<MouseWheel>", _wheel, add="+")  # Windows / Mac
-        settings_canvas.bind("<Button-4>", lambda _e: settings_canvas.yview_scroll(-3, "units"), add="+")  # Linux
-        settings_canvas.bind("<Button-5>", lambda _e: settings_canvas.yview_scroll(3, "units"), add="+")   # Linux
+        settings_canvas.bind("<MouseWheel>", _canvas_wheel, add="+")  # Windows / Mac
+        settings_canvas.bind("<Button-4>", _canvas_wheel, add="+")  # Linux
+        settings_canvas.bind("<Button-5>", _canvas_wheel, add="+")  # Linux
 
 
 
@@ -5238,7 +5662,7 @@ class PowerTraderHub(tk.Tk):
         wc = 0
         for platform in ["kucoin", "binance", "binance_us", "coinbase", "coingecko", "robinhood"]:
             btn = ttk.Button(wizard_frame, text=f"Setup {platform.title()}", 
-                           command=lambda p=platform: create_setup_wizard(p))
+                           command=functools.partial(create_setup_wizard, platform))
             btn.grid(row=wr, column=wc, sticky="ew", padx=(0, 10), pady=2)
             wc += 1
             if wc >= 3:
@@ -5256,13 +5680,7 @@ class PowerTraderHub(tk.Tk):
         def open_keys_folder():
             """Open the folder containing encrypted API keys."""
             try:
-                folder = os.path.abspath(self.project_dir)
-                if os.name == "nt":
-                    os.startfile(folder)
-                elif sys.platform == "darwin":
-                    subprocess.Popen(["open", folder])
-                else:
-                    subprocess.Popen(["xdg-open", folder])
+                _open_path(os.path.abspath(self.project_dir))
             except Exception as e:
                 messagebox.showerror("Couldn't open folder", f"Error: {e}")
         
@@ -391,6 +391,9 @@ except Exception:
 	pass
 
 RUNNER_READY_PATH = os.path.join(HUB_DIR, "runner_ready.json")
+# Printed once when we first become ready; the hub watches our stdout for it (keep in sync)
+RUNNER_READY_MARKER = "[RUNNER-READY]"
+_ready_marker_printed = False
 
 def _atomic_write_json(path: str, data: dict) -> None:
 	try:
@@ -401,7 +404,37 @@ def _atomic_write_json(path: str, data: dict) -> None:
 	except Exception:
 		pass
 
+def _atomic_write_text(path: str, text: str) -> None:
+	# tmp + os.replace so the hub/trader never read a half-written file.
+	# On Windows os.replace fails (PermissionError) while a reader has `path` open, so retry
+	# briefly, then fall back to a plain write: these files drive trading and must not go stale.
+	tmp = path + ".tmp"
+	try:
+		with open(tmp, "w", encoding="utf-8") as f:
+			f.write(text)
+		for attempt in range(5):
+			try:
+				os.replace(tmp, path)
+				return
+			except OSError:
+				time.sleep(0.01 * (attempt + 1))
+	except OSError:
+		pass
+	finally:
+		try:
+			if os.path.exists(tmp):
+				os.remove(tmp)
+		except OSError:
+			pass
+
+	try:
+		with open(path, "w", encoding="utf-8") as f:
+			f.write(text)
+	except Exception:
+		PrintException()
+
 def _write_runner_ready(ready: bool, stage: str, ready_coins=None, total_coins: int = 0) -> None:
+	global _ready_marker_printed
 	obj = {
 		"timestamp": time.time(),
 		"ready": bool(ready),
@@ -410,6 +443,9 @@ def _write_runner_ready(ready: bool, stage: str, ready_coins=None, total_coins:
 		"total_coins": int(total_coins or 0),
 	}
 	_atomic_write_json(RUNNER_READY_PATH, obj)
+	if ready and not _ready_marker_printed:
+		_ready_marker_printed = True
+		print(RUNNER_READY_MARKER, flush=True)
 
 
 # Ensure folders exist for the current configured coins
@@ -1117,10 +1153,8 @@ def step_coin(sym: str):
 		# bump bounds_version now that we've computed a new set of prediction bounds
 		st['bounds_version'] = bounds_version_used_for_messages + 1
 
-		with open('low_bound_prices.html', 'w+') as file:
-			file.write(str(new_low_bound_prices).replace("', '", " ").replace("[", "").replace("]", "").replace("'", ""))
-		with open('high_bound_prices.html', 'w+') as file:
-			file.write(str(new_high_bound_prices).replace("', '", " ").replace("[", "").replace("]", "").replace("'", ""))
+		_atomic_write_text('low_bound_prices.html', str(new_low_bound_prices).replace("', '", " ").replace("[", "").replace("]", "").replace("'", ""))
+		_atomic_write_text('high_bound_prices.html', str(new_high_bound_prices).replace("', '", " ").replace("[", "").replace("]", "").replace("'", ""))
 
 		# cache display text for this coin (main loop prints everything on one screen)
 		try:
@@ -1170,10 +1204,8 @@ def step_coin(sym: str):
 			except:
 				pm = 0.25
 
-			with open('futures_long_profit_margin.txt', 'w+') as f:
-				f.write(str(pm))
-			with open('long_dca_signal.txt', 'w+') as f:
-				f.write(str(longs))
+			_atomic_write_text('futures_long_profit_margin.txt', str(pm))
+			_atomic_write_text('long_dca_signal.txt', str(longs))
 
 			# short pm
 			current_pms = [m for m in margins if m != 0]
@@ -1184,10 +1216,8 @@ def step_coin(sym: str):
 			except:
 				pm = 0.25
 
-			with open('futures_short_profit_margin.txt', 'w+') as f:
-				f.write(str(abs(pm)))
-			with open('short_dca_signal.txt', 'w+') as f:
-				f.write(str(shorts))
+			_atomic_write_text('futures_short_profit_margin.txt', str(abs(pm)))
+			_atomic_write_text('short_dca_signal.txt', str(shorts))
 
 		except:
 			PrintException()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for the small numpy / file helpers in pt_hub.py.
+
+These don't open any windows; they only exercise the module-level helpers
+used by the charts and the trade-history list.
+"""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pt_hub
+
+
+# ---- _nearest_sorted_index ----
+
+def test_nearest_index_empty_values_raises():
+    try:
+        pt_hub._nearest_sorted_index(np.array([], dtype=np.float64), np.array([1.0]))
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError for an empty array")
+
+
+def test_nearest_index_no_targets():
+    idx = pt_hub._nearest_sorted_index(np.array([1.0, 2.0]), np.array([], dtype=np.float64))
+    assert idx.shape == (0,)
+
+
+def test_nearest_index_outside_range():
+    vals = np.array([10.0, 20.0, 30.0])
+    idx = pt_hub._nearest_sorted_index(vals, np.array([-5.0, 10.0, 30.0, 99.0]))
+    assert idx.tolist() == [0, 0, 2, 2]
+
+
+def test_nearest_index_ties_go_left():
+    vals = np.array([10.0, 20.0, 30.0])
+    idx = pt_hub._nearest_sorted_index(vals, np.array([15.0, 25.0, 14.9, 15.1]))
+    assert idx.tolist() == [0, 1, 0, 1]
+
+
+def test_nearest_index_single_value():
+    idx = pt_hub._nearest_sorted_index(np.array([5.0]), np.array([-1.0, 5.0, 7.0]))
+    assert idx.tolist() == [0, 0, 0]
+
+
+# ---- _trade_window ----
+
+def _trades(ts):
+    n = len(ts)
+    return pt_hub._TradeArrays(
+        ts=np.asarray(ts, dtype=np.float64),
+        kind=np.zeros(n, dtype=np.int8),
+        coin=np.array(["BTC"] * n, dtype=object),
+        price=np.ones(n, dtype=np.float64),
+    )
+
+
+def test_trade_window_inclusive_bounds():
+    ta = _trades([1.0, 2.0, 3.0, 4.0, 5.0])
+    w = pt_hub._trade_window(ta, 2.0, 4.0)
+    assert ta.ts[w].tolist() == [2.0, 3.0, 4.0]
+
+
+def test_trade_window_min_after_max_is_empty():
+    ta = _trades([1.0, 2.0, 3.0, 4.0, 5.0])
+    w = pt_hub._trade_window(ta, 4.0, 2.0)
+    assert ta.ts[w].tolist() == []
+    assert w.start == w.stop
+
+
+def test_trade_window_outside_range():
+    ta = _trades([1.0, 2.0, 3.0])
+    assert ta.ts[pt_hub._trade_window(ta, 10.0, 20.0)].tolist() == []
+    assert ta.ts[pt_hub._trade_window(ta, -5.0, 0.5)].tolist() == []
+    assert ta.ts[pt_hub._trade_window(ta, -5.0, 50.0)].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_trade_window_no_trades():
+    ta = _trades([])
+    assert ta.ts[pt_hub._trade_window(ta, 0.0, 10.0)].tolist() == []
+
+
+# ---- _bucket_means (account-value downsampling) ----
+
+def test_bucket_means_passthrough_when_small():
+    pts = [(1.0, 10.0), (2.0, 20.0)]
+    assert pt_hub._bucket_means(pts, 5) == pts
+    assert pt_hub._bucket_means([], 5) == []
+
+
+def test_bucket_means_even_buckets():
+    pts = [(float(i), float(i * 10)) for i in range(6)]
+    assert pt_hub._bucket_means(pts, 3) == [(0.5, 5.0), (2.5, 25.0), (4.5, 45.0)]
+
+
+def test_bucket_means_uneven_final_bucket():
+    # 7 points into 3 buckets -> starts 0, 2, 4 -> sizes 2, 2, 3
+    pts = [(float(i), float(i * 10)) for i in range(7)]
+    out = pt_hub._bucket_means(pts, 3)
+    assert len(out) == 3
+    assert out[0] == (0.5, 5.0)
+    assert out[1] == (2.5, 25.0)
+    assert out[2] == (5.0, 50.0)
+
+
+def test_bucket_means_matches_python_loop():
+    rng = np.random.default_rng(0)
+    pts = [(float(t), float(v)) for t, v in zip(range(1000), rng.normal(100.0, 5.0, 1000))]
+    max_keep = 250
+    n = len(pts)
+    size = n / float(max_keep)
+    expected = []
+    for i in range(max_keep):
+        chunk = pts[int(i * size):int((i + 1) * size)]
+        expected.append((sum(p[0] for p in chunk) / len(chunk), sum(p[1] for p in chunk) / len(chunk)))
+    got = pt_hub._bucket_means(pts, max_keep)
+    assert len(got) == max_keep
+    assert np.allclose(np.array(got), np.array(expected))
+
+
+# ---- _tail_lines ----
+
+def _tail_of(content: bytes, n: int, block: int = 65536):
+    fd, path = tempfile.mkstemp(suffix=".jsonl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        return pt_hub._tail_lines(path, n, block=block)
+    finally:
+        os.remove(path)
+
+
+def test_tail_lines_no_trailing_newline():
+    assert _tail_of(b"a\nb\nc", 2) == ["b", "c"]
+    assert _tail_of(b"a\nb\nc\n", 2) == ["b", "c"]
+
+
+def test_tail_lines_shorter_than_n():
+    assert _tail_of(b"a\nb\n", 10) == ["a", "b"]
+    assert _tail_of(b"only", 3) == ["only"]
+    assert _tail_of(b"", 3) == []
+
+
+def test_tail_lines_zero_lines():
+    assert _tail_of(b"a\nb\n", 0) == []
+
+
+def test_tail_lines_crlf():
+    assert _tail_of(b"a\r\nb\r\nc\r\n", 2) == ["b", "c"]
+
+
+def test_tail_lines_across_small_blocks():
+    lines = [f"line {i}" for i in range(100)]
+    content = ("\n".join(lines)).encode("utf-8")
+    for block in (1, 3, 7, 64):
+        assert _tail_of(content, 5, block=block) == lines[-5:]
+        assert _tail_of(content, 250, block=block) == lines
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_") and callable(fn)]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+            print(f"✓ {name}")
+        except Exception as e:
+            failed += 1
+            print(f"✗ {name}: {e!r}")
+    print(f"\n{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(1 if failed else 0)